@@ -8,37 +8,62 @@ Provides web API and frontend for interactive SRM recommendations and hostname l
 Usage:
     python run_chatbot.py
     python run_chatbot.py --host 0.0.0.0 --port 8000
+    python run_chatbot.py --workers 4
+
+Each worker process holds its own in-memory index, chat sessions and
+temp SRMs, so only raise --workers (or WEB_CONCURRENCY) when that state
+does not need to be shared between requests.
 """
 
 import asyncio
 import argparse
+import hashlib
 import json
-import uuid
+import os
+import secrets
 import sys
+from contextlib import suppress
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, Any, TypedDict
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, Awaitable, Callable, Mapping, TypedDict, TypeVar
+
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from semantic_kernel.processes.kernel_process import KernelProcessEvent
 from semantic_kernel.processes.local_runtime.local_kernel_process import start
 from semantic_kernel.contents import ChatHistory
 from semantic_kernel.contents.utils.author_role import AuthorRole
 
-from src.utils.kernel_builder import create_kernel
-from src.utils.telemetry import TelemetryLogger
+from src.utils.kernel_builder import create_kernel, create_http_client
+from src.utils.execution_settings import WARMUP_SETTINGS
+from src.utils.telemetry import NullTelemetryLogger, TelemetryLogger
 from src.utils.store_factory import create_vector_store
-from src.utils.debug_config import debug_print
-from src.data.data_loader import SRMDataLoader
+from src.utils.embedding_cache import EmbeddingCache
+from src.utils.query_cache import CachedAnswer, QueryCache, normalize_query
+from src.utils.debug_config import DEBUG as _DEBUG, debug_print
+from src.data.data_loader import (
+    SRMDataLoader,
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_EMBED_CONCURRENCY,
+)
 from src.processes.discovery.srm_discovery_process import SRMDiscoveryProcess
 from src.processes.discovery.hostname_lookup_process import HostnameLookupProcess
 from src.memory.feedback_store import FeedbackStore
 from src.utils.feedback_processor import FeedbackProcessor
 from src.models.feedback_record import FeedbackRecord, FeedbackType
+from src.models.srm_record import SRMRecord
+from src.models.process_state import ResultContainer
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 # FastAPI app
@@ -48,38 +73,101 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Compress JSON and HTML responses; bodies below the minimum are not worth it
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.getenv("GZIP_MIN_SIZE", "512")),
+    compresslevel=int(os.getenv("GZIP_LEVEL", "5"))
+)
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets browsers and proxies cache assets.
+
+    The assets in web/ are not content-hashed, so they get a bounded max-age
+    rather than "immutable"; Starlette's ETag/Last-Modified handling still
+    answers revalidation requests with 304.
+    """
+
+    def __init__(self, *args, max_age: int = 3600, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", self.cache_control)
+        return response
+
+
+# Frontend assets, resolved once relative to this file rather than the working directory
+_WEB_DIR = Path(__file__).resolve().parent / "web"
+
 # Mount static files
-app.mount("/static", StaticFiles(directory="web"), name="static")
+app.mount(
+    "/static",
+    CachedStaticFiles(
+        directory=str(_WEB_DIR),
+        max_age=int(os.getenv("STATIC_CACHE_MAX_AGE", "3600"))
+    ),
+    name="static"
+)
+
+# Process start event IDs, resolved once instead of on every request
+_SRM_START_EVENT_ID = SRMDiscoveryProcess.ProcessEvents.StartProcess.value
+_HOSTNAME_START_EVENT_ID = HostnameLookupProcess.ProcessEvents.StartProcess.value
+
+# FeedbackRequest.feedback_type values; anything else is treated as negative
+_FEEDBACK_TYPE_MAP = {
+    "positive": FeedbackType.POSITIVE,
+    "negative": FeedbackType.NEGATIVE,
+}
 
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
 
+# The hot-path models are immutable; request models also reject unknown
+# fields and strip surrounding whitespace from strings during validation
+_REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+_RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True)
+
+
 class QueryRequest(BaseModel):
     """Request model for query endpoint."""
+    model_config = _REQUEST_MODEL_CONFIG
+
     query: str
 
 
 class QueryResponse(BaseModel):
     """Response model for query endpoint."""
+    model_config = _RESPONSE_MODEL_CONFIG
+
     response: str
     session_id: str
 
 
 class HostnameRequest(BaseModel):
     """Request model for hostname lookup endpoint."""
+    model_config = _REQUEST_MODEL_CONFIG
+
     hostname: str
 
 
 class HostnameResponse(BaseModel):
     """Response model for hostname lookup endpoint."""
+    model_config = _RESPONSE_MODEL_CONFIG
+
     response: str
     session_id: str
 
 
 class FeedbackRequest(BaseModel):
     """Request model for feedback endpoint."""
+    model_config = _REQUEST_MODEL_CONFIG
+
     session_id: str
     incorrect_srm_id: str | None = None
     incorrect_srm_name: str | None = None
@@ -93,6 +181,8 @@ class FeedbackRequest(BaseModel):
 
 class FeedbackResponse(BaseModel):
     """Response model for feedback endpoint."""
+    model_config = _RESPONSE_MODEL_CONFIG
+
     success: bool
     message: str
     feedback_id: str | None = None
@@ -226,20 +316,95 @@ class TempSRMDeleteResponse(BaseModel):
 # STARTUP
 # ============================================================================
 
+async def _index_srm_catalog(vector_store, embedding_service) -> None:
+    """
+    Load and index the SRM catalog, or verify the Azure AI Search index.
+
+    Args:
+        vector_store: Vector store created at startup
+        embedding_service: Embedding service used to pre-embed records
+    """
+    store_type = os.getenv('VECTOR_STORE_TYPE', 'in_memory').lower()
+
+    if store_type == 'in_memory':
+        # Load SRM data from CSV for in-memory store
+        print("[*] Loading SRM data from srm_index.csv...")
+        cache_dir = os.getenv('EMBEDDING_CACHE_DIR', 'cache/embeddings')
+        data_loader = SRMDataLoader(
+            vector_store,
+            embedding_generator=embedding_service,
+            embed_batch_size=int(os.getenv('EMBED_BATCH_SIZE', str(DEFAULT_EMBED_BATCH_SIZE))),
+            embed_concurrency=int(os.getenv('EMBED_CONCURRENCY', str(DEFAULT_EMBED_CONCURRENCY))),
+            embedding_cache=EmbeddingCache(
+                cache_dir,
+                dtype=os.getenv('EMBEDDING_CACHE_DTYPE', 'float16')
+            ) if cache_dir else None
+        )
+        num_records = await data_loader.load_and_index("data/srm_index.csv")
+        print(f"[+] Loaded and indexed {num_records} SRM records")
+
+    else:
+        # Azure AI Search - data already exists in the index
+        print("[*] Using existing Azure AI Search index...")
+        # Deployments that create the index in CI/init containers skip the check
+        if not os.getenv('SKIP_ENSURE_COLLECTION'):
+            await vector_store.ensure_collection_exists()
+        print("[+] Azure AI Search index ready")
+
+
+async def _warm_up_connections(kernel) -> None:
+    """
+    Send a tiny embedding and chat request so DNS, TLS and the pooled
+    connections are set up before the first user query.
+
+    Failures are only reported; the first real request will retry them.
+
+    Args:
+        kernel: Kernel with "chat" and "embedding" services
+    """
+    try:
+        await asyncio.gather(
+            kernel.get_service("embedding").generate_embeddings(["warmup"]),
+            kernel.get_service("chat").get_chat_message_content(
+                ChatHistory(system_message="ping"),
+                settings=WARMUP_SETTINGS
+            ),
+        )
+        print("[+] Embedding and chat connections warmed up")
+    except Exception as e:
+        print(f"[!] Connection warmup failed: {e}")
+
+
+def _build_processes():
+    """
+    Build the process definitions once; they are reused for all requests.
+
+    Returns:
+        Tuple of (SRM discovery process, hostname lookup process)
+    """
+    return (
+        SRMDiscoveryProcess.create_process().build(),
+        HostnameLookupProcess.create_process().build(),
+    )
+
+
 @app.on_event("startup")
 async def startup_event():
     """
     Initialize the kernel, vector store, build processes, and load SRM data on startup.
     """
-    import os
-
     print("\n" + "=" * 80)
     print("AI CONCIERGE - RECOMMENDER CHATBOT SERVICE")
     print("=" * 80)
 
+    # Shared HTTP client so chat and embedding calls reuse pooled connections
+    print("[*] Creating shared HTTP client...")
+    app.state.http = create_http_client()
+    print("[+] HTTP client created")
+
     # Create kernel with chat and embedding services
     print("[*] Initializing Semantic Kernel...")
-    app.state.kernel = create_kernel()
+    app.state.kernel = create_kernel(http_client=app.state.http)
     print("[+] Kernel initialized")
 
     # Get embedding service
@@ -251,45 +416,47 @@ async def startup_event():
     app.state.vector_store = create_vector_store(embedding_service)
     print("[+] Vector store created")
 
-    # Load data based on store type
-    store_type = os.getenv('VECTOR_STORE_TYPE', 'in_memory').lower()
-
-    if store_type == 'in_memory':
-        # Load SRM data from CSV for in-memory store
-        print("[*] Loading SRM data from srm_index.csv...")
-        data_loader = SRMDataLoader(app.state.vector_store)
-        num_records = await data_loader.load_and_index("data/srm_index.csv")
-        print(f"[+] Loaded and indexed {num_records} SRM records")
-
-    else:
-        # Azure AI Search - data already exists in the index
-        print("[*] Using existing Azure AI Search index...")
-        await app.state.vector_store.ensure_collection_exists()
-        print("[+] Azure AI Search index ready")
-
-    # Build process definitions once (they will be reused for all requests)
-    print("[*] Building process definitions...")
-    srm_process_builder = SRMDiscoveryProcess.create_process()
-    app.state.srm_process = srm_process_builder.build()
-
-    hostname_process_builder = HostnameLookupProcess.create_process()
-    app.state.hostname_process = hostname_process_builder.build()
+    # Catalog indexing (network-bound) overlaps with building the process
+    # definitions and opening the telemetry/feedback files in worker threads
+    print("[*] Indexing SRM data, building processes and initializing telemetry/feedback...")
+    startup_tasks = [
+        _index_srm_catalog(app.state.vector_store, embedding_service),
+        asyncio.to_thread(_build_processes),
+        asyncio.to_thread(TelemetryLogger),
+        asyncio.to_thread(FeedbackStore),
+    ]
+    if os.getenv('WARMUP', '1') == '1':
+        startup_tasks.append(_warm_up_connections(app.state.kernel))
+    _, processes, telemetry, feedback_store, *_ = await asyncio.gather(*startup_tasks)
+    app.state.srm_process, app.state.hostname_process = processes
+    app.state.telemetry = telemetry
+    app.state.telemetry.start()
+    app.state.feedback_store = feedback_store
     print("[+] Process definitions built")
-
-    # Initialize telemetry
-    print("[*] Initializing telemetry...")
-    app.state.telemetry = TelemetryLogger()
     print("[+] Telemetry initialized")
 
-    # Initialize feedback system
-    print("[*] Initializing feedback system...")
-    app.state.feedback_store = FeedbackStore()
     app.state.feedback_processor = FeedbackProcessor(
         feedback_store=app.state.feedback_store,
         vector_store=app.state.vector_store
     )
+
+    # Bounded queue drained by a fixed pool of workers, so feedback bursts
+    # cannot fan out into unbounded concurrent index updates
+    app.state.feedback_queue = asyncio.Queue(maxsize=int(os.getenv('FEEDBACK_QUEUE_SIZE', '1000')))
+    feedback_batch_size = int(os.getenv('FEEDBACK_BATCH_SIZE', '32'))
+    app.state.feedback_workers = [
+        asyncio.create_task(_feedback_worker(feedback_batch_size))
+        for _ in range(int(os.getenv('FEEDBACK_WORKERS', '4')))
+    ]
     print("[+] Feedback system initialized")
 
+    # Dependencies shared by every process run; requests layer their own fields on top
+    app.state.base_query_ctx = MappingProxyType({
+        "kernel": app.state.kernel,
+        "vector_store": app.state.vector_store,
+        "feedback_processor": app.state.feedback_processor,
+    })
+
     # Initialize concierge plugin for API endpoints
     print("[*] Initializing concierge plugin...")
     from src.plugins.concierge.srm_metadata_plugin import SRMMetadataPlugin
@@ -298,21 +465,44 @@ async def startup_event():
     )
     print("[+] Concierge plugin initialized")
 
-    # Initialize session storage for multi-turn conversations
-    app.state.chat_sessions: Dict[str, Dict[str, Any]] = {}
-    print("[+] Chat session management initialized")
+    # Final answers for repeated discovery queries
+    app.state.query_cache = QueryCache(
+        maxsize=int(os.getenv('QUERY_CACHE_SIZE', '1024')),
+        ttl=float(os.getenv('QUERY_CACHE_TTL', '600')),
+        bypass_pattern=os.getenv('QUERY_CACHE_BYPASS') or None
+    )
+
+    # Precomputed answers for common queries, filled by _refresh_canned_answers;
+    # index_generation counts SRM index changes so a refresh that overlaps
+    # one is discarded
+    app.state.canned_answers = QueryCache(maxsize=0)
+    app.state.index_generation = 0
+    app.state.canned_refresh_requested = asyncio.Event()
+
+    # In-flight pipeline runs keyed by hashed normalized input (single-flight
+    # dedup), each with the session ID its telemetry is logged under
+    app.state.inflight: Dict[bytes, tuple[asyncio.Task, str]] = {}
 
     # Initialize temp SRM storage
     app.state.temp_srms: Dict[str, Any] = {}  # Maps SRM-TEMP-XXX to SRMRecord
     app.state.temp_id_counter: int = 1
     print("[+] Temp SRM storage initialized")
 
+    # Read the frontend page once; serve_frontend returns it from memory
+    html_path = _WEB_DIR / "index.html"
+    app.state.index_html = html_path.read_bytes() if html_path.exists() else None
+    if app.state.index_html is None:
+        print(f"[!] Frontend not found at {html_path}")
+    else:
+        # Content hash lets browsers revalidate with If-None-Match and get a 304
+        app.state.index_etag = f'"{hashlib.blake2b(app.state.index_html, digest_size=16).hexdigest()}"'
+
     # Store server configuration (will be set by main())
     app.state.server_host = os.getenv('CHATBOT_HOST', '0.0.0.0')
     app.state.server_port = int(os.getenv('CHATBOT_PORT', '8000'))
 
-    # Start background task for session cleanup
-    asyncio.create_task(_cleanup_old_sessions())
+    # Answer common queries ahead of time (in the background, so startup is not held up)
+    app.state.canned_refresh_task = asyncio.create_task(_refresh_canned_answers())
 
     print("=" * 80)
     print("SERVICE READY")
@@ -321,45 +511,84 @@ async def startup_event():
     print("=" * 80 + "\n")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Release resources created during startup.
+
+    Queued feedback is applied before the workers stop, waiting up to
+    FEEDBACK_DRAIN_SECONDS (default 10).
+    """
+    feedback_queue = getattr(app.state, 'feedback_queue', None)
+    if feedback_queue is not None and not feedback_queue.empty():
+        print(f"[*] Applying {feedback_queue.qsize()} queued feedback records...")
+        try:
+            await asyncio.wait_for(
+                feedback_queue.join(),
+                timeout=float(os.getenv('FEEDBACK_DRAIN_SECONDS', '10'))
+            )
+        except asyncio.TimeoutError:
+            print(f"[!] Stopped with {feedback_queue.qsize()} feedback records not applied")
+
+    for worker in getattr(app.state, 'feedback_workers', []):
+        worker.cancel()
+
+    canned_refresh_task = getattr(app.state, 'canned_refresh_task', None)
+    if canned_refresh_task is not None:
+        canned_refresh_task.cancel()
+
+    telemetry = getattr(app.state, 'telemetry', None)
+    if telemetry is not None:
+        await telemetry.aclose()
+        print("[+] Telemetry flushed")
+
+    http_client = getattr(app.state, 'http', None)
+    if http_client is not None:
+        await http_client.aclose()
+        print("[+] HTTP client closed")
+
+
 # ============================================================================
 # QUERY PROCESSING
 # ============================================================================
 
 async def run_query(
-    kernel,
-    vector_store,
+    base_ctx: Mapping[str, Any],
     srm_process,
     telemetry,
     user_query: str,
-    session_id: str
+    session_id: str,
+    query_cache: QueryCache | None = None
 ) -> str:
     """
     Run a single query through the discovery process.
 
     Args:
-        kernel: Semantic Kernel instance
-        vector_store: Vector store with SRM data
+        base_ctx: Shared read-only event data (kernel, vector_store, feedback_processor)
         srm_process: Pre-built process definition
         telemetry: Telemetry logger
         user_query: The user's query
         session_id: Session identifier
+        query_cache: Optional cache that receives the final answer
 
     Returns:
         The final answer or clarification question
     """
-    # Create initial event data with user_query, vector_store, session_id, kernel, and feedback_processor
+    # Layer the per-request fields over the shared kernel/vector_store/feedback_processor
     # Note: SK ProcessBuilder requires passing dependencies through events, not constructors
     # result_container will be populated by steps with the final output
-    result_container = {}
+    result_container = ResultContainer()
     initial_data = {
+        **base_ctx,
         "user_query": user_query,
-        "vector_store": vector_store,
         "session_id": session_id,
-        "kernel": kernel,
         "result_container": result_container,
-        "feedback_processor": app.state.feedback_processor,
     }
 
+    # Answers are only cached if the index has not changed while this run
+    # was in progress (an SRM update clears the cache)
+    cache_generation = query_cache.generation if query_cache is not None else None
+
     # Start process
     telemetry.log_process_state_change(
         session_id=session_id,
@@ -372,38 +601,47 @@ async def run_query(
         # Use pre-built process definition (reused for all requests)
         async with await start(
             process=srm_process,
-            kernel=kernel,
+            kernel=base_ctx["kernel"],
             initial_event=KernelProcessEvent(
-                id=SRMDiscoveryProcess.ProcessEvents.StartProcess.value,
+                id=_SRM_START_EVENT_ID,
                 data=initial_data
             ),
             max_supersteps=50,
         ) as process_context:
-            # Get final state
-            final_state = await process_context.get_state()
-
-            # Debug: print state info
-            debug_print(f"DEBUG: Process completed. State: {type(final_state)}")
-            if hasattr(final_state, 'name'):
-                debug_print(f"DEBUG: Process name: {final_state.name}")
-
-            # Result was populated by steps via result_container
-            result_data = result_container
-            debug_print(f"DEBUG: Retrieved result for session {session_id}: {result_data}")
-
-            if result_data:
-                if 'rejection_message' in result_data:
-                    return f"[!] {result_data['rejection_message']}"
-                elif 'clarification' in result_data:
-                    return f"[?] {result_data['clarification']}"
-                elif 'final_answer' in result_data:
-                    # Log telemetry
-                    telemetry.log_answer_published(
-                        session_id=session_id,
-                        selected_id=result_data.get('selected_id'),
-                        confidence=result_data.get('confidence', 0.0)
+            # Debug: print state info (snapshotting every step's state is
+            # only worth it when someone will read it)
+            if _DEBUG:
+                final_state = await process_context.get_state()
+                debug_print(f"DEBUG: Process completed. State: {type(final_state)}")
+                if hasattr(final_state, 'name'):
+                    debug_print(f"DEBUG: Process name: {final_state.name}")
+
+                # Result was populated by steps via result_container
+                debug_print(f"DEBUG: Retrieved result for session {session_id}: {result_container}")
+
+            if result_container.rejection_message is not None:
+                return f"[!] {result_container.rejection_message}"
+            elif result_container.clarification is not None:
+                return f"[?] {result_container.clarification}"
+            elif result_container.final_answer is not None:
+                # Log telemetry
+                telemetry.log_answer_published(
+                    session_id=session_id,
+                    selected_id=result_container.selected_id,
+                    confidence=result_container.confidence
+                )
+                # Only final answers are cached; rejections and clarifications are not
+                if query_cache is not None:
+                    query_cache.put(
+                        user_query,
+                        CachedAnswer(
+                            answer=result_container.final_answer,
+                            selected_id=result_container.selected_id,
+                            confidence=result_container.confidence
+                        ),
+                        generation=cache_generation
                     )
-                    return result_data['final_answer']
+                return result_container.final_answer
 
             return "Process completed but no result was generated."
 
@@ -417,7 +655,7 @@ async def run_query(
 
 
 async def run_hostname_query(
-    kernel,
+    base_ctx: Mapping[str, Any],
     hostname_process,
     telemetry,
     hostname_query: str,
@@ -427,7 +665,7 @@ async def run_hostname_query(
     Run a hostname lookup query.
 
     Args:
-        kernel: Semantic Kernel instance
+        base_ctx: Shared read-only event data (kernel, vector_store, feedback_processor)
         hostname_process: Pre-built process definition
         telemetry: Telemetry logger
         hostname_query: The hostname to look up
@@ -436,14 +674,14 @@ async def run_hostname_query(
     Returns:
         The formatted hostname information
     """
-    # Create initial event data with user_query, session_id, and kernel
+    # Layer the per-request fields over the shared kernel
     # Note: SK ProcessBuilder requires passing dependencies through events, not constructors
     # result_container will be populated by steps with the final output
-    result_container = {}
+    result_container = ResultContainer()
     initial_data = {
+        **base_ctx,
         "user_query": hostname_query,
         "session_id": session_id,
-        "kernel": kernel,
         "result_container": result_container,
     }
 
@@ -459,37 +697,35 @@ async def run_hostname_query(
         # Use pre-built process definition (reused for all requests)
         async with await start(
             process=hostname_process,
-            kernel=kernel,
+            kernel=base_ctx["kernel"],
             initial_event=KernelProcessEvent(
-                id=HostnameLookupProcess.ProcessEvents.StartProcess.value,
+                id=_HOSTNAME_START_EVENT_ID,
                 data=initial_data
             ),
             max_supersteps=50,
         ) as process_context:
-            # Get final state
-            final_state = await process_context.get_state()
-
-            # Debug: print state info
-            debug_print(f"DEBUG: Process completed. State: {type(final_state)}")
-            if hasattr(final_state, 'name'):
-                debug_print(f"DEBUG: Process name: {final_state.name}")
-
-            # Result was populated by steps via result_container
-            result_data = result_container
-            debug_print(f"DEBUG: Retrieved result for session {session_id}: {result_data}")
-
-            if result_data:
-                if 'rejection_message' in result_data:
-                    return f"[!] {result_data['rejection_message']}"
-                elif 'answer' in result_data:
-                    # Log telemetry
-                    telemetry.log_process_state_change(
-                        session_id=session_id,
-                        process="HostnameLookupProcess",
-                        from_state="running",
-                        to_state="completed"
-                    )
-                    return result_data['answer']
+            # Debug: print state info (snapshotting every step's state is
+            # only worth it when someone will read it)
+            if _DEBUG:
+                final_state = await process_context.get_state()
+                debug_print(f"DEBUG: Process completed. State: {type(final_state)}")
+                if hasattr(final_state, 'name'):
+                    debug_print(f"DEBUG: Process name: {final_state.name}")
+
+                # Result was populated by steps via result_container
+                debug_print(f"DEBUG: Retrieved result for session {session_id}: {result_container}")
+
+            if result_container.rejection_message is not None:
+                return f"[!] {result_container.rejection_message}"
+            elif result_container.answer is not None:
+                # Log telemetry
+                telemetry.log_process_state_change(
+                    session_id=session_id,
+                    process="HostnameLookupProcess",
+                    from_state="running",
+                    to_state="completed"
+                )
+                return result_container.answer
 
             return "Process completed but no result was generated."
 
@@ -502,41 +738,200 @@ async def run_hostname_query(
         return f"[!] An error occurred: {str(e)}"
 
 
+def _inflight_key(kind: str, payload: str) -> bytes:
+    """
+    Build the single-flight key for a normalized request payload.
+
+    Args:
+        kind: Request kind, keeps query and hostname keys apart
+        payload: Normalized request payload
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(f"{kind}:{payload}".encode("utf-8"), digest_size=16).digest()
+
+
+async def _run_single_flight(
+    key: bytes,
+    session_id: str,
+    run: Callable[[], Awaitable[str]]
+) -> tuple[str, str]:
+    """
+    Run a pipeline once for all concurrent requests with the same key.
+
+    The first caller starts the run; callers arriving while it is still in
+    flight await the same task instead of launching a duplicate. The task is
+    shielded so one caller disconnecting does not cancel it for the others.
+
+    Telemetry for a shared run is recorded under the session ID of the
+    caller that started it, so every caller gets that ID back; feedback
+    sent with it then joins to the logged query events.
+
+    Args:
+        key: Single-flight key from _inflight_key()
+        session_id: Session ID of this caller, used if it starts the run
+        run: Zero-argument callable returning the pipeline coroutine
+            (logging telemetry under session_id)
+
+    Returns:
+        Tuple of (pipeline response, session ID the run was logged under)
+    """
+    inflight = app.state.inflight
+    entry = inflight.get(key)
+    if entry is None:
+        task = asyncio.ensure_future(run())
+        entry = inflight[key] = (task, session_id)
+
+        def _forget(_: asyncio.Task, entry=entry) -> None:
+            # The entry may already have been replaced after an index change
+            if inflight.get(key) is entry:
+                del inflight[key]
+
+        task.add_done_callback(_forget)
+    task, run_session_id = entry
+    return await asyncio.shield(task), run_session_id
+
+
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
-@app.post("/api/query", response_model=QueryResponse)
-async def query_endpoint(request: QueryRequest):
+# The hot endpoints (/api/query, /api/hostname) validate the raw body with
+# model_validate_json and return pre-serialized JSON, skipping FastAPI's
+# body-parameter resolution and its second validation of the response model.
+
+def _json_request_body(model: type[BaseModel]) -> dict:
+    """
+    Build the OpenAPI requestBody for an endpoint that reads the raw request.
+
+    Args:
+        model: Pydantic model describing the JSON body
+
+    Returns:
+        openapi_extra dict documenting the body schema
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+async def _parse_json_body(request: Request, model: type[ModelT]) -> ModelT:
+    """
+    Validate the raw JSON request body against a model.
+
+    Args:
+        request: Incoming HTTP request
+        model: Pydantic model to validate against
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON for the model (422)
+    """
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Prefix locations with "body" to match FastAPI's own validation errors
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
+
+def _json_response(model: BaseModel, headers: Dict[str, str] | None = None) -> Response:
+    """
+    Serialize a response model directly to a JSON response.
+
+    Args:
+        model: Response model instance
+        headers: Optional extra response headers
+
+    Returns:
+        Response carrying the model's JSON
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json", headers=headers)
+
+
+def _orjson_response(payload: Dict[str, Any]) -> Response:
+    """
+    Serialize a plain dict payload to a JSON response with orjson.
+
+    Endpoints with a response_model already serialize through pydantic-core;
+    this covers the dict-returning health and stats endpoints.
+
+    Args:
+        payload: JSON-serializable dict
+
+    Returns:
+        Response carrying the payload's JSON
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+@app.post(
+    "/api/query",
+    response_model=QueryResponse,
+    openapi_extra=_json_request_body(QueryRequest)
+)
+async def query_endpoint(request: Request):
     """
     Process a user query and return the response.
 
     Args:
-        request: QueryRequest containing the user's query
+        request: HTTP request whose JSON body is a QueryRequest
 
     Returns:
         QueryResponse with the response and session_id
     """
-    if not request.query or not request.query.strip():
+    body = await _parse_json_body(request, QueryRequest)
+    user_query = body.query
+    if not user_query:
         raise HTTPException(status_code=400, detail="Query cannot be empty")
 
     # Generate unique session ID for this request
-    session_id = str(uuid.uuid4())[:8]
+    session_id = secrets.token_hex(8)
+
+    cached = app.state.canned_answers.get(user_query)
+    if cached is None:
+        cached = app.state.query_cache.get(user_query)
+    if cached is not None:
+        # Log the hit under this request's session ID, so feedback sent with
+        # it joins to an answer event and cached traffic shows in analytics
+        app.state.telemetry.log_answer_published(
+            session_id=session_id,
+            selected_id=cached.selected_id,
+            confidence=cached.confidence,
+            cache_hit=True
+        )
+        return _json_response(
+            QueryResponse(response=cached.answer, session_id=session_id),
+            headers={"X-Cache": "HIT"}
+        )
 
     try:
-        # Run the query through the process
-        response = await run_query(
-            kernel=app.state.kernel,
-            vector_store=app.state.vector_store,
-            srm_process=app.state.srm_process,
-            telemetry=app.state.telemetry,
-            user_query=request.query.strip(),
-            session_id=session_id
+        # Run the query through the process, sharing the run with any
+        # identical query that is already in flight
+        response, session_id = await _run_single_flight(
+            _inflight_key("query", normalize_query(user_query)),
+            session_id,
+            lambda: run_query(
+                base_ctx=app.state.base_query_ctx,
+                srm_process=app.state.srm_process,
+                telemetry=app.state.telemetry,
+                user_query=user_query,
+                session_id=session_id,
+                query_cache=app.state.query_cache
+            )
         )
 
-        return QueryResponse(
-            response=response,
-            session_id=session_id
+        return _json_response(
+            QueryResponse(response=response, session_id=session_id),
+            headers={"X-Cache": "MISS"}
         )
 
     except Exception as e:
@@ -544,37 +939,48 @@ async def query_endpoint(request: QueryRequest):
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
 
 
-@app.post("/api/hostname", response_model=HostnameResponse)
-async def hostname_endpoint(request: HostnameRequest):
+@app.post(
+    "/api/hostname",
+    response_model=HostnameResponse,
+    openapi_extra=_json_request_body(HostnameRequest)
+)
+async def hostname_endpoint(request: Request):
     """
     Look up hostname details and return the information.
 
     Args:
-        request: HostnameRequest containing the hostname to look up
+        request: HTTP request whose JSON body is a HostnameRequest
 
     Returns:
         HostnameResponse with the hostname details and session_id
     """
-    if not request.hostname or not request.hostname.strip():
+    body = await _parse_json_body(request, HostnameRequest)
+    hostname_query = body.hostname
+    if not hostname_query:
         raise HTTPException(status_code=400, detail="Hostname cannot be empty")
 
     # Generate unique session ID for this request
-    session_id = str(uuid.uuid4())[:8]
+    session_id = secrets.token_hex(8)
 
     try:
-        # Run the hostname lookup
-        response = await run_hostname_query(
-            kernel=app.state.kernel,
-            hostname_process=app.state.hostname_process,
-            telemetry=app.state.telemetry,
-            hostname_query=request.hostname.strip(),
-            session_id=session_id
+        # Run the hostname lookup, sharing the run with any identical
+        # lookup that is already in flight
+        response, session_id = await _run_single_flight(
+            _inflight_key("hostname", hostname_query),
+            session_id,
+            lambda: run_hostname_query(
+                base_ctx=app.state.base_query_ctx,
+                hostname_process=app.state.hostname_process,
+                telemetry=app.state.telemetry,
+                hostname_query=hostname_query,
+                session_id=session_id
+            )
         )
 
-        return HostnameResponse(
+        return _json_response(HostnameResponse(
             response=response,
             session_id=session_id
-        )
+        ))
 
     except Exception as e:
         print(f"[!] Error processing hostname lookup: {e}")
@@ -592,14 +998,16 @@ async def feedback_endpoint(request: FeedbackRequest):
     Returns:
         FeedbackResponse with success status and feedback ID
     """
+    # Backpressure: refuse new feedback while the processing queue is full
+    if app.state.feedback_queue.full():
+        raise HTTPException(status_code=503, detail="Feedback queue is full, please retry later")
+
     try:
-        # Determine feedback type
+        # Determine feedback type; a supplied correct SRM always makes it a correction
         if request.correct_srm_id:
             feedback_type = FeedbackType.CORRECTION
-        elif request.feedback_type == "positive":
-            feedback_type = FeedbackType.POSITIVE
         else:
-            feedback_type = FeedbackType.NEGATIVE
+            feedback_type = _FEEDBACK_TYPE_MAP.get(request.feedback_type, FeedbackType.NEGATIVE)
 
         # Create feedback record
         feedback = FeedbackRecord(
@@ -614,10 +1022,10 @@ async def feedback_endpoint(request: FeedbackRequest):
             feedback_type=feedback_type,
         )
 
-        # Store feedback
-        app.state.feedback_store.add_feedback(feedback)
+        # Store feedback (appends to the JSONL file, so keep it off the event loop)
+        await run_in_threadpool(app.state.feedback_store.add_feedback, feedback)
 
-        # Log telemetry
+        # Log telemetry (buffered, so safe to call on the event loop)
         app.state.telemetry.log_feedback_submitted(
             session_id=request.session_id,
             feedback_id=feedback.id,
@@ -627,38 +1035,67 @@ async def feedback_endpoint(request: FeedbackRequest):
             user_id=request.user_id
         )
 
-        # Process feedback asynchronously (don't wait)
-        asyncio.create_task(
-            _process_feedback_async(
-                feedback=feedback,
-                feedback_processor=app.state.feedback_processor,
-                telemetry=app.state.telemetry
-            )
-        )
-
-        return FeedbackResponse(
-            success=True,
-            message="Thank you for your feedback! We'll use this to improve future recommendations.",
-            feedback_id=feedback.id
-        )
-
     except Exception as e:
         print(f"[!] Error processing feedback: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing feedback: {str(e)}")
 
+    # Hand off to the feedback workers (don't wait)
+    try:
+        app.state.feedback_queue.put_nowait(feedback)
+    except asyncio.QueueFull:
+        # Filled up while this request was storing; the stored record stays
+        # unapplied, so tell the client rather than report success
+        print(f"[!] Feedback queue full, not applying feedback {feedback.id}")
+        raise HTTPException(status_code=503, detail="Feedback queue is full, please retry later")
+
+    return FeedbackResponse(
+        success=True,
+        message="Thank you for your feedback! We'll use this to improve future recommendations.",
+        feedback_id=feedback.id
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (RFC 9110 section 13.1.2).
+
+    The header is "*" or a comma-separated list of entity tags, compared
+    weakly, so a W/ prefix on either side is ignored.
+
+    Args:
+        if_none_match: If-None-Match header value, if sent
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @app.get("/", response_class=HTMLResponse)
-async def serve_frontend():
+async def serve_frontend(request: Request):
     """
     Serve the main HTML page.
+
+    Returns 304 when the browser's cached copy (If-None-Match) is current.
     """
-    html_path = Path(__file__).parent / "web" / "index.html"
+    index_html = getattr(app.state, 'index_html', None)
 
-    if not html_path.exists():
+    if index_html is None:
         raise HTTPException(status_code=404, detail="Frontend not found")
 
-    with open(html_path, "r", encoding="utf-8") as f:
-        return f.read()
+    headers = {"ETag": app.state.index_etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), app.state.index_etag):
+        return Response(status_code=304, headers=headers)
+
+    return HTMLResponse(content=index_html, headers=headers)
 
 
 @app.post("/api/srm-update-chat", response_model=SrmUpdateChatResponse)
@@ -669,7 +1106,7 @@ async def srm_update_chat_endpoint(request: SrmUpdateChatRequest):
     The SRM update functionality has been moved to the email monitoring agent.
     This endpoint returns a helpful message directing users to use email instead.
     """
-    session_id = request.session_id or str(uuid.uuid4())
+    session_id = request.session_id or secrets.token_hex(8)
 
     response_message = (
         "The SRM update chat feature has been moved to email-based processing. "
@@ -714,9 +1151,9 @@ async def concierge_search_endpoint(request: ConciergeSearchRequest):
             top_k=request.top_k
         )
 
-        results = json.loads(result_json)
+        results = orjson.loads(result_json)
 
-        return ConciergeSearchResponse(results=results)
+        return _json_response(ConciergeSearchResponse(results=results))
 
     except Exception as e:
         print(f"[!] Error in concierge search: {e}")
@@ -747,12 +1184,12 @@ async def concierge_get_endpoint(request: ConciergeGetRequest):
             srm_id=request.srm_id
         )
 
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
 
         if not result.get("success"):
-            return ConciergeGetResponse(srm=None, error=result.get("error", "Unknown error"))
+            return _json_response(ConciergeGetResponse(srm=None, error=result.get("error", "Unknown error")))
 
-        return ConciergeGetResponse(srm=result["srm"], error=None)
+        return _json_response(ConciergeGetResponse(srm=result["srm"], error=None))
 
     except Exception as e:
         print(f"[!] Error in concierge get: {e}")
@@ -791,7 +1228,7 @@ async def concierge_update_endpoint(request: ConciergeUpdateRequest):
             updates=updates_json
         )
 
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
 
         if not result.get("success"):
             return ConciergeUpdateResponse(
@@ -800,6 +1237,8 @@ async def concierge_update_endpoint(request: ConciergeUpdateRequest):
                 error=result.get("error", "Unknown error")
             )
 
+        _invalidate_cached_answers()
+
         return ConciergeUpdateResponse(
             success=True,
             srm_id=result["srm_id"],
@@ -843,7 +1282,7 @@ async def concierge_batch_update_endpoint(request: ConciergeBatchUpdateRequest):
             updates=updates_json
         )
 
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
 
         if not result.get("success"):
             return ConciergeBatchUpdateResponse(
@@ -853,6 +1292,8 @@ async def concierge_batch_update_endpoint(request: ConciergeBatchUpdateRequest):
                 error=result.get("error", "Unknown error")
             )
 
+        _invalidate_cached_answers()
+
         return ConciergeBatchUpdateResponse(
             success=True,
             updated_count=result["updated_count"],
@@ -881,19 +1322,19 @@ async def concierge_health_endpoint():
 
         status = "healthy" if (has_plugin and has_vector_store) else "degraded"
 
-        return {
+        return _orjson_response({
             "status": status,
             "service": "concierge-api",
             "plugin_initialized": has_plugin,
             "vector_store_initialized": has_vector_store,
             "timestamp": datetime.now().isoformat()
-        }
+        })
     except Exception as e:
-        return {
+        return _orjson_response({
             "status": "unhealthy",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
-        }
+        })
 
 
 @app.get("/api/concierge/stats")
@@ -928,20 +1369,20 @@ async def concierge_stats_endpoint():
         # Count temp SRMs
         temp_count = len(app.state.temp_srms) if hasattr(app.state, 'temp_srms') else 0
 
-        return {
+        return _orjson_response({
             "total_srms": total_count,
             "temp_srms": temp_count,
             "chatbot_url": chatbot_url,
             "status": "healthy"
-        }
+        })
     except Exception as e:
-        return {
+        return _orjson_response({
             "total_srms": 0,
             "temp_srms": 0,
             "chatbot_url": chatbot_url,
             "status": "error",
             "error": str(e)
-        }
+        })
 
 
 @app.post("/api/concierge/temp/create", response_model=TempSRMCreateResponse)
@@ -961,8 +1402,6 @@ async def temp_srm_create_endpoint(request: TempSRMCreateRequest):
         app.state.temp_id_counter += 1
 
         # Create SRMRecord
-        from src.models.srm_record import SRMRecord
-
         temp_srm = SRMRecord(
             id=temp_id,
             name=request.name,
@@ -979,6 +1418,7 @@ async def temp_srm_create_endpoint(request: TempSRMCreateRequest):
 
         # Also add to vector store for search (in-memory only)
         await app.state.vector_store.upsert([temp_srm])
+        _invalidate_cached_answers()
 
         print(f"[+] Created temp SRM: {temp_id} - {request.name}")
 
@@ -1055,72 +1495,208 @@ async def temp_srm_delete_endpoint(request: TempSRMDeleteRequest):
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
+    return _orjson_response({
         "status": "healthy",
         "service": "recommender-chatbot",
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 
 # ============================================================================
 # BACKGROUND TASKS
 # ============================================================================
 
-async def _process_feedback_async(
-    feedback: FeedbackRecord,
+async def _process_feedback_batch(
+    batch: list[FeedbackRecord],
     feedback_processor: FeedbackProcessor,
     telemetry: TelemetryLogger
 ):
     """
-    Process feedback asynchronously in the background.
+    Process a batch of feedback records in the background.
 
     Args:
-        feedback: FeedbackRecord to process
+        batch: FeedbackRecords to process
         feedback_processor: FeedbackProcessor instance
         telemetry: TelemetryLogger instance
     """
     try:
-        success = await feedback_processor.process_feedback(feedback)
-        telemetry.log_feedback_processed(
-            feedback_id=feedback.id,
-            success=success
-        )
+        results = await feedback_processor.process_feedback_batch(batch)
     except Exception as e:
+        for feedback in batch:
+            telemetry.log_feedback_processed(
+                feedback_id=feedback.id,
+                success=False,
+                error_message=str(e)
+            )
+        return
+
+    if any(results):
+        # Applied feedback can change rankings, so cached answers are stale
+        _invalidate_cached_answers()
+    for feedback, success in zip(batch, results):
         telemetry.log_feedback_processed(
             feedback_id=feedback.id,
-            success=False,
-            error_message=str(e)
+            success=success
         )
 
 
-async def _cleanup_old_sessions():
+async def _feedback_worker(batch_size: int):
     """
-    Background task to clean up old chat sessions (>1 hour inactive).
+    Background worker that applies queued feedback in batches.
+
+    Waits for one record, then takes whatever else is already queued (up to
+    batch_size) so a burst is persisted with one feedback file rewrite.
+
+    Args:
+        batch_size: Maximum records applied together
     """
+    queue = app.state.feedback_queue
     while True:
+        batch = [await queue.get()]
+        while len(batch) < batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            await _process_feedback_batch(
+                batch=batch,
+                feedback_processor=app.state.feedback_processor,
+                telemetry=app.state.telemetry
+            )
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _invalidate_cached_answers():
+    """
+    Drop cached and precomputed answers after the SRM index changes.
+
+    In-flight runs are detached too, so later requests start a fresh run
+    against the updated index instead of joining one that started before
+    the change, and the precomputed answers are rebuilt.
+    """
+    app.state.query_cache.clear()
+    app.state.canned_answers.clear()
+    app.state.inflight.clear()
+
+    # Rebuild the precomputed answers against the updated index
+    app.state.index_generation += 1
+    app.state.canned_refresh_requested.set()
+
+
+def _load_common_queries(path: str) -> list[str]:
+    """
+    Read common queries, one per line, skipping blanks and '#' comments.
+
+    Args:
+        path: Path to the common queries file
+
+    Returns:
+        List of queries (empty if the file does not exist)
+    """
+    queries_path = Path(path)
+    if not queries_path.exists():
+        return []
+
+    queries = []
+    for line in queries_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            queries.append(line)
+    return queries
+
+
+async def _precompute_answer(query: str, canned: QueryCache, semaphore: asyncio.Semaphore):
+    """
+    Run one common query into the canned answer set.
+
+    Failures are logged and skipped so one bad query does not discard the
+    rest of the refresh.
+
+    Args:
+        query: Common query to answer
+        canned: Canned answer cache being built
+        semaphore: Caps how many common queries run at once
+    """
+    async with semaphore:
         try:
-            await asyncio.sleep(300)  # Check every 5 minutes
+            await run_query(
+                base_ctx=app.state.base_query_ctx,
+                srm_process=app.state.srm_process,
+                # Synthetic runs must not be counted as user queries
+                telemetry=NullTelemetryLogger(),
+                user_query=query,
+                session_id="warmup",
+                query_cache=canned
+            )
+        except Exception as e:
+            print(f"[!] Error precomputing answer for '{query}': {e}")
 
-            current_time = datetime.now()
-            sessions_to_delete = []
 
-            for session_id, session_data in app.state.chat_sessions.items():
-                last_activity = session_data.get('last_activity', session_data.get('created_at'))
-                if current_time - last_activity > timedelta(hours=1):
-                    sessions_to_delete.append(session_id)
+async def _refresh_canned_answers():
+    """
+    Background task that runs common queries through the discovery process
+    and keeps their final answers in app.state.canned_answers.
 
-            for session_id in sessions_to_delete:
-                del app.state.chat_sessions[session_id]
-                print(f"[*] Cleaned up inactive chat session: {session_id}")
+    Refreshes every CANNED_REFRESH_SECONDS (default 30 minutes), and right
+    away after _invalidate_cached_answers() reports an index change. A
+    refresh that was running when the index changed is discarded, since
+    its answers may come from the old index.
+    """
+    queries_file = os.getenv('COMMON_QUERIES_FILE', 'data/common_queries.txt')
+    interval = int(os.getenv('CANNED_REFRESH_SECONDS', '1800'))
+    semaphore = asyncio.Semaphore(int(os.getenv('CANNED_REFRESH_CONCURRENCY', '4')))
+    refresh_requested = app.state.canned_refresh_requested
 
+    while True:
+        refresh_requested.clear()
+        generation = app.state.index_generation
+        try:
+            queries = _load_common_queries(queries_file)
+            if queries:
+                print(f"[*] Precomputing answers for {len(queries)} common queries...")
+                # Never expire; the whole set is replaced on the next refresh
+                canned = QueryCache(maxsize=len(queries), ttl=float("inf"))
+                await asyncio.gather(*[
+                    _precompute_answer(query, canned, semaphore)
+                    for query in queries
+                ])
+                if app.state.index_generation == generation:
+                    app.state.canned_answers = canned
+                    print(f"[+] Precomputed {len(canned)} common query answers")
+                else:
+                    print("[*] SRM index changed during precompute, discarding answers")
         except Exception as e:
-            print(f"[!] Error in session cleanup: {e}")
+            print(f"[!] Error precomputing common queries: {e}")
+
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(refresh_requested.wait(), timeout=interval)
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+def _parse_workers(value: str) -> int:
+    """
+    Parse the --workers value.
+
+    Args:
+        value: Worker count, or "auto" for 2 x CPU cores + 1
+
+    Returns:
+        Number of worker processes
+    """
+    if value.strip().lower() == "auto":
+        return (os.cpu_count() or 1) * 2 + 1
+    workers = int(value)
+    if workers < 1:
+        raise argparse.ArgumentTypeError("--workers must be at least 1")
+    return workers
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -1143,21 +1719,35 @@ def main():
         action="store_true",
         help="Enable auto-reload on code changes"
     )
+    parser.add_argument(
+        "--workers",
+        type=_parse_workers,
+        default=os.getenv("WEB_CONCURRENCY", "1"),
+        help="Number of worker processes, or 'auto' for 2 x CPU cores + 1 "
+             "(default: WEB_CONCURRENCY or 1; ignored with --reload)"
+    )
 
     args = parser.parse_args()
 
     # Set environment variables for server configuration so startup_event can access them
-    import os
     os.environ['CHATBOT_HOST'] = args.host
     os.environ['CHATBOT_PORT'] = str(args.port)
 
     import uvicorn
 
+    # uvloop is not available on Windows; fall back to the default asyncio loop there
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
     uvicorn.run(
         "run_chatbot:app",
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        workers=None if args.reload else args.workers,
+        loop=loop,
+        http="httptools",
+        backlog=2048,
+        timeout_keep_alive=30
     )
 
 
@@ -23,7 +23,7 @@ from semantic_kernel.contents import ChatHistory, ChatMessageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 
-from src.utils.kernel_builder import create_kernel
+from src.utils.kernel_builder import create_kernel, create_http_client
 from src.plugins.cli_concierge.api_client_plugin import ConciergeAPIClientPlugin
 
 
@@ -59,6 +59,7 @@ class CLIConciergeAgent:
         self.kernel: Kernel | None = None
         self.agent: ChatCompletionAgent | None = None
         self.history: ChatHistory | None = None
+        self.http_client = None
 
     async def initialize(self) -> bool:
         """
@@ -68,14 +69,21 @@ class CLIConciergeAgent:
             True if successful, False otherwise
         """
         try:
+            # One pooled HTTP client for Azure OpenAI and chatbot API calls
+            self.http_client = create_http_client()
+
             # Create kernel
             print("[*] Initializing Semantic Kernel...")
-            self.kernel = create_kernel()
+            self.kernel = create_kernel(http_client=self.http_client)
             print("[+] Kernel initialized")
 
             # Add API client plugin
             print(f"[*] Connecting to chatbot service at {self.chatbot_url}...")
-            api_client = ConciergeAPIClientPlugin(base_url=self.chatbot_url, debug=self.debug)
+            api_client = ConciergeAPIClientPlugin(
+                base_url=self.chatbot_url,
+                debug=self.debug,
+                http_client=self.http_client
+            )
             self.kernel.add_plugin(api_client, plugin_name="api_client")
             print("[+] API client plugin loaded")
 
@@ -256,6 +264,12 @@ Be conversational, friendly, and helpful. Always confirm before making changes."
             print(f"\n[ERROR] Failed to initialize: {e}")
             return False
 
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
     async def run_repl(self):
         """Run the interactive REPL loop."""
         # Install signal handler for immediate Ctrl+C exit
@@ -326,12 +340,15 @@ async def main():
     # Initialize and run agent with debug flag
     agent = CLIConciergeAgent(debug=args.debug)
 
-    if not await agent.initialize():
-        print("[!] Failed to initialize. Exiting.")
-        sys.exit(1)
-
-    # Run REPL
-    await agent.run_repl()
+    try:
+        if not await agent.initialize():
+            print("[!] Failed to initialize. Exiting.")
+            sys.exit(1)
+
+        # Run REPL
+        await agent.run_repl()
+    finally:
+        await agent.close()
 
 
 if __name__ == "__main__":
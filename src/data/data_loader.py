@@ -2,11 +2,30 @@
 Data loader for SRM catalog from CSV files.
 '''
 
+import asyncio
+import logging
+
 import pandas as pd
 from pathlib import Path
 
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+
 from src.models.srm_record import SRMRecord
 from src.memory.vector_store_base import VectorStoreBase
+from src.utils.embedding_cache import EmbeddingCache
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default number of texts sent per embedding request
+DEFAULT_EMBED_BATCH_SIZE = 64
+
+# Default number of embedding requests in flight at once
+DEFAULT_EMBED_CONCURRENCY = 16
+
+# srm_index.csv columns read into SRMRecords, in the order unpacked by load_srm_catalog
+CATALOG_COLUMNS = ('SRM_ID', 'Name', 'Type', 'Team', 'Description')
 
 
 class SRMDataLoader:
@@ -14,14 +33,40 @@ class SRMDataLoader:
     Load and process SRM catalog data from CSV files.
     '''
     
-    def __init__(self, vector_store: VectorStoreBase):
+    def __init__(
+        self,
+        vector_store: VectorStoreBase,
+        embedding_generator: EmbeddingGeneratorBase | None = None,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        embed_concurrency: int = DEFAULT_EMBED_CONCURRENCY,
+        max_retries: int = 3,
+        embedding_cache: EmbeddingCache | None = None
+    ):
         '''
         Initialize the data loader.
         
         Args:
             vector_store: The vector store to populate with SRM records
+            embedding_generator: Optional embedding service. When provided, records
+                                are embedded in batches before upsert instead of
+                                one request per record inside the store.
+            embed_batch_size: Number of texts per embedding request
+            embed_concurrency: Maximum number of embedding requests in flight
+            max_retries: Attempts per batch before giving up (default: 3)
+            embedding_cache: Optional on-disk cache so unchanged records are
+                            not re-embedded on every load
         '''
+        if embed_batch_size <= 0:
+            raise ValueError(f"embed_batch_size must be positive, got {embed_batch_size}")
+        if embed_concurrency <= 0:
+            raise ValueError(f"embed_concurrency must be positive, got {embed_concurrency}")
+        
         self.vector_store = vector_store
+        self.embedding_generator = embedding_generator
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self.max_retries = max_retries
+        self.embedding_cache = embedding_cache
     
     def parse_srm_metadata(self, metadata_str: str) -> tuple[str, str]:
         '''
@@ -63,25 +108,151 @@ class SRMDataLoader:
         if not csv_path.exists():
             raise FileNotFoundError(f"SRM catalog file not found: {csv_path}")
 
-        # Read CSV
-        df = pd.read_csv(csv_path)
+        # Read only the columns used, as strings, off the event loop
+        df = await asyncio.to_thread(
+            pd.read_csv,
+            csv_path,
+            usecols=list(CATALOG_COLUMNS),
+            dtype=str
+        )
+
+        # Search text for every row in one vectorized concatenation
+        # (na_rep keeps the "nan" the per-row f-string used to produce)
+        texts = df['Name'].str.cat(
+            [df['Type'], df['Description'], df['Team']],
+            sep=' ',
+            na_rep='nan'
+        )
 
-        # Parse and create SRM records
-        records = []
-        for _, row in df.iterrows():
+        # Parse and create SRM records column-wise (iterrows builds a Series per row)
+        records = [
             # Create record from srm_index.csv format
-            record = SRMRecord(
-                id=row['SRM_ID'],
-                name=row['Name'],
-                category=row['Type'],
-                owning_team=row['Team'],
-                use_case=row['Description'],
-                text=f"{row['Name']} {row['Type']} {row['Description']} {row['Team']}",
+            SRMRecord(
+                id=srm_id,
+                name=name,
+                category=srm_type,
+                owning_team=team,
+                use_case=description,
+                text=text,
             )
-            records.append(record)
+            for srm_id, name, srm_type, team, description, text in zip(
+                *(df[column] for column in CATALOG_COLUMNS), texts
+            )
+        ]
 
         return records
     
+    async def embed_records(self, records: list[SRMRecord]) -> None:
+        '''
+        Generate embeddings for records in batches.
+        
+        Records whose embedding field still holds source text are embedded in
+        place. When an embedding cache is configured, only texts missing from
+        the cache are sent to the embedding service. Records whose text could
+        not be embedded keep their source text and are logged.
+        
+        Args:
+            records: SRM records to embed
+        '''
+        pending = [record for record in records if isinstance(record.embedding, str)]
+        if not pending:
+            return
+        
+        texts = [record.embedding for record in pending]
+        if self.embedding_cache is not None:
+            model_id = getattr(self.embedding_generator, 'ai_model_id', '') or ''
+            embeddings = await self.embedding_cache.get_or_compute(texts, model_id, self.embed_texts)
+        else:
+            embeddings = await self.embed_texts(texts)
+        
+        failed = []
+        for record, embedding in zip(pending, embeddings):
+            if embedding is None:
+                failed.append(record.id)
+            else:
+                record.embedding = embedding
+        if failed:
+            logger.error("Could not embed %d SRM records: %s", len(failed), ", ".join(failed))
+    
+    async def embed_texts(self, texts: list[str]) -> list[list[float] | None]:
+        '''
+        Embed texts in concurrent batches.
+        
+        Duplicate texts are embedded once. Texts are sent embed_batch_size
+        per request, longest first so each batch holds texts of similar
+        length. Batches are dispatched concurrently, at most
+        embed_concurrency at a time.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding per text, in input order (None for a text that
+            failed on its own after all retries)
+        '''
+        unique_texts = list(dict.fromkeys(texts))
+        order = sorted(range(len(unique_texts)), key=lambda i: len(unique_texts[i]), reverse=True)
+        batches = [
+            order[start:start + self.embed_batch_size]
+            for start in range(0, len(order), self.embed_batch_size)
+        ]
+        
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+        results = await asyncio.gather(
+            *(self._embed_batch([unique_texts[i] for i in batch], semaphore) for batch in batches)
+        )
+        
+        by_text: dict[str, list[float] | None] = {}
+        for batch, batch_embeddings in zip(batches, results):
+            for i, embedding in zip(batch, batch_embeddings):
+                by_text[unique_texts[i]] = embedding
+        return [by_text[text] for text in texts]
+    
+    async def _embed_batch(self, texts: list[str], semaphore: asyncio.Semaphore) -> list[list[float] | None]:
+        '''
+        Embed one batch of texts, retrying with exponential backoff.
+        
+        A failing batch (e.g. rate limited) backs off on its own without
+        holding up the other batches. If a multi-text batch still fails after
+        all retries, its texts are embedded in single-text requests so a single
+        bad text does not fail the rest of the batch. A single text that still
+        fails is logged and gets None instead of failing the load.
+        
+        Args:
+            texts: Texts to embed in a single request
+            semaphore: Limits the number of concurrent requests
+            
+        Returns:
+            One embedding per text (None for a single text that failed)
+        '''
+        for attempt in range(self.max_retries):
+            try:
+                async with semaphore:
+                    embeddings = await self.embedding_generator.generate_embeddings(texts)
+                break
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    if len(texts) == 1:
+                        logger.error("Embedding failed after %d attempts: %s", self.max_retries, e)
+                        return [None]
+                    logger.warning(
+                        "Embedding batch of %d texts failed (%s), falling back to one text per request",
+                        len(texts), e
+                    )
+                    # Single-text requests run concurrently, capped by the same semaphore
+                    results = await asyncio.gather(*[
+                        self._embed_batch([text], semaphore) for text in texts
+                    ])
+                    return [embedding for result in results for embedding in result]
+                # Wait before retry (exponential backoff): 0.5s, 1s, 2s
+                await asyncio.sleep(0.5 * (2 ** attempt))
+        
+        # Convert numpy arrays to plain Python lists if needed
+        return [
+            embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
+            for embedding in embeddings
+        ]
+    
     async def load_and_index(self, csv_path: str | Path = "data/srm_index.csv") -> int:
         '''
         Load SRM catalog and index it in the vector store.
@@ -90,7 +261,8 @@ class SRMDataLoader:
             csv_path: Path to the srm_index.csv file
 
         Returns:
-            Number of records indexed
+            Number of records indexed (records that could not be embedded
+            are left out)
         '''
         # Ensure collection exists
         await self.vector_store.ensure_collection_exists()
@@ -98,6 +270,13 @@ class SRMDataLoader:
         # Load records
         records = await self.load_srm_catalog(csv_path)
         
+        # Embed in batches up front so the store does not embed record by record
+        if self.embedding_generator is not None:
+            await self.embed_records(records)
+            # Leave out records that could not be embedded rather than
+            # failing startup (embed_records has logged them)
+            records = [record for record in records if not isinstance(record.embedding, str)]
+        
         # Upsert to vector store
         await self.vector_store.upsert(records)
         
@@ -217,4 +217,21 @@ class FeedbackStore:
             feedback.applied_to_index = True
             self.update_feedback(feedback)
             logger.info(f"Marked feedback {feedback_id} as applied to index")
-
+    
+    def mark_all_as_applied(self, feedback_ids: list[str]) -> None:
+        '''
+        Mark several feedback records as applied with a single file rewrite.
+        
+        Args:
+            feedback_ids: IDs of feedback to mark as applied
+        '''
+        marked = 0
+        for feedback_id in feedback_ids:
+            feedback = self.feedback_cache.get(feedback_id)
+            if feedback:
+                feedback.applied_to_index = True
+                marked += 1
+        
+        if marked:
+            self._rewrite_feedback_file()
+            logger.info(f"Marked {marked} feedback records as applied to index")
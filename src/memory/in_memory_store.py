@@ -2,6 +2,7 @@
 In-memory vector store implementation using Semantic Kernel.
 '''
 
+import heapq
 from typing import Any, AsyncIterator
 
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
@@ -9,8 +10,9 @@ from semantic_kernel.connectors.in_memory import InMemoryStore
 
 from src.memory.vector_store_base import VectorStoreBase
 from src.models.srm_record import SRMRecord
-from src.utils.text_matching import search_record_fields
+from src.utils.text_matching import score_records
 from src.utils.ranking import reciprocal_rank_fusion
+from src.utils.embedding_batcher import QueryEmbeddingBatcher
 
 
 class SearchResult:
@@ -61,19 +63,25 @@ class InMemoryVectorStore(VectorStoreBase):
         >>>     print(f"{result.record.name}: {result.score}")
     '''
     
-    def __init__(self, embedding_generator: EmbeddingGeneratorBase):
+    def __init__(self, embedding_generator: EmbeddingGeneratorBase, query_batch_size: int = 16):
         '''
         Initialize the in-memory vector store.
         
         Args:
             embedding_generator: The embedding generator service to use
+            query_batch_size: Maximum concurrent search queries embedded in
+                             one request
         '''
         self.embedding_generator = embedding_generator
+        self.query_batcher = QueryEmbeddingBatcher(embedding_generator, max_batch=query_batch_size)
         self.store = InMemoryStore()
         self.collection = None
     
     async def ensure_collection_exists(self) -> None:
-        '''Ensure the collection exists in the store.'''
+        '''Ensure the collection exists in the store (no-op once ensured).'''
+        if self.collection is not None:
+            return
+
         # Don't pass embedding_generator here since we manually generate embeddings
         self.collection = self.store.get_collection(
             record_type=SRMRecord
@@ -90,13 +98,15 @@ class InMemoryVectorStore(VectorStoreBase):
         if not self.collection:
             await self.ensure_collection_exists()
         
-        # Generate embeddings for records that need them
-        for record in records:
-            if isinstance(record.embedding, str):
-                # The embedding field contains text - generate the actual embedding
-                embeddings = await self.embedding_generator.generate_embeddings([record.embedding])
+        # Generate embeddings for records that need them (the embedding field
+        # still holds text) in one request rather than one per record
+        pending = [record for record in records if isinstance(record.embedding, str)]
+        if pending:
+            embeddings = await self.embedding_generator.generate_embeddings(
+                [record.embedding for record in pending]
+            )
+            for record, embedding in zip(pending, embeddings):
                 # Convert numpy array to plain Python list if needed
-                embedding = embeddings[0]
                 if hasattr(embedding, 'tolist'):
                     embedding = embedding.tolist()
                 record.embedding = embedding
@@ -149,11 +159,8 @@ class InMemoryVectorStore(VectorStoreBase):
             return empty_iterator()
 
         # 1. Vector search (semantic similarity)
-        # Generate embedding for the query
-        query_embeddings = await self.embedding_generator.generate_embeddings([query])
-        query_embedding = query_embeddings[0]
-        if hasattr(query_embedding, 'tolist'):
-            query_embedding = query_embedding.tolist()
+        # Generate embedding for the query (batched with concurrent searches)
+        query_embedding = await self.query_batcher.embed(query)
 
         # Fetch more results for better RRF coverage
         vector_results = await self.collection.search(vector=query_embedding, top=top_k * 2)
@@ -168,33 +175,28 @@ class InMemoryVectorStore(VectorStoreBase):
         all_records_result = await self.collection.search(vector=query_embedding, top=1000)
         all_records = [result.record async for result in all_records_result.results]
 
-        keyword_scored = []
-        for record in all_records:
-            score = search_record_fields(query, record)
-            if score >= fuzzy_threshold:
-                keyword_scored.append((record, score))
+        keyword_scored = [
+            (record, score)
+            for record, score in zip(all_records, score_records(query, all_records))
+            if score >= fuzzy_threshold
+        ]
 
-        # Sort by keyword score
-        keyword_scored.sort(key=lambda x: x[1], reverse=True)
-        keyword_records = [record for record, score in keyword_scored[:top_k * 2]]
+        # Keep the best top_k * 2 by keyword score (same order as a full stable sort)
+        keyword_records = [
+            record for record, score in heapq.nlargest(top_k * 2, keyword_scored, key=lambda x: x[1])
+        ]
 
         # 3. Reciprocal Rank Fusion
         rrf_results = reciprocal_rank_fusion(vector_records, keyword_records, k=rrf_k)
 
-        # 4. Get top_k record IDs from RRF
-        top_ids = [record_id for record_id, score in rrf_results[:top_k]]
-
-        # 5. Fetch full records in RRF order
-        final_results = []
-        for record_id in top_ids:
-            record = await self.collection.get(record_id)
-            if record:
-                # Create a result object with RRF score
-                result = SearchResult(
-                    record=record,
-                    score=dict(rrf_results)[record_id]  # RRF score
-                )
-                final_results.append(result)
+        # 4. Take the top_k from RRF, reusing the records both searches already
+        # returned instead of fetching each one again
+        records_by_id = {record.id: record for record in keyword_records}
+        records_by_id.update((record.id, record) for record in vector_records)
+        final_results = [
+            SearchResult(record=records_by_id[record_id], score=score)  # RRF score
+            for record_id, score in rrf_results[:top_k]
+        ]
 
         # Return as async iterator
         async def result_iterator():
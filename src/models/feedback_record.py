@@ -3,7 +3,7 @@ Feedback record model for user feedback on SRM recommendations.
 '''
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 from uuid import uuid4
@@ -46,7 +46,7 @@ class FeedbackRecord:
     correct_srm_name: Optional[str] = None
     feedback_text: Optional[str] = None
     feedback_type: FeedbackType = FeedbackType.NEGATIVE
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     applied_to_index: bool = False
     
     def to_dict(self) -> dict:
@@ -83,7 +83,7 @@ class FeedbackRecord:
             correct_srm_name=data.get('correct_srm_name'),
             feedback_text=data.get('feedback_text'),
             feedback_type=feedback_type,
-            timestamp=data.get('timestamp', datetime.utcnow().isoformat()),
+            timestamp=data.get('timestamp', datetime.now(timezone.utc).isoformat()),
             applied_to_index=data.get('applied_to_index', False),
         )
 
@@ -61,3 +61,30 @@ class ProcessState:
     is_complete: bool = False
     final_answer: str = ""
 
+
+
+@dataclass(slots=True)
+class ResultContainer:
+    '''
+    Output slot shared between a process run and its caller.
+    
+    The entry point creates one per request and passes it through the
+    process events; the terminal step fills it in with the outcome.
+    '''
+    
+    # Rejection (input validation steps)
+    rejection_message: Optional[str] = None
+    rejection_reason: Optional[str] = None
+    
+    # SRM discovery outcome
+    clarification: Optional[str] = None
+    final_answer: Optional[str] = None
+    selected_id: Optional[str] = None
+    confidence: float = 0.0
+    retrieved_context: list[dict] = field(default_factory=list)
+    
+    # Hostname lookup outcome
+    answer: Optional[str] = None
+    hostname: Optional[str] = None
+    application_name: Optional[str] = None
+    match_count: int = 0
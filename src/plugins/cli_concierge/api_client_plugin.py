@@ -5,12 +5,15 @@ Makes HTTP requests to the chatbot concierge API endpoints.
 """
 
 import httpx
-import json
 import logging
-from typing import Annotated
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
 
+import orjson
 from semantic_kernel.functions import kernel_function
 
+from src.utils.json_output import dumps_result
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +27,36 @@ class ConciergeAPIClientPlugin:
     HTTP requests only.
     """
 
-    def __init__(self, base_url: str = "http://localhost:8000", debug: bool = False):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        debug: bool = False,
+        http_client: httpx.AsyncClient | None = None
+    ):
         """
         Initialize API client plugin.
 
         Args:
             base_url: Base URL of chatbot service (hardcoded for demo)
             debug: Enable debug output for function calls
+            http_client: Optional shared HTTP client whose pooled connections
+                        are reused across calls; owned by the caller
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = 30.0
         self.debug = debug
+        self.http_client = http_client
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yield the shared HTTP client, or a short-lived one if none was given.
+        """
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
 
     @staticmethod
     def normalize_srm_id(srm_id: str) -> str:
@@ -100,7 +122,7 @@ class ConciergeAPIClientPlugin:
             print("[*] Searching...", flush=True)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/api/concierge/search",
                     json={"query": query, "top_k": top_k}
@@ -110,15 +132,15 @@ class ConciergeAPIClientPlugin:
                     data = response.json()
                     results = data.get("results", [])
                     logger.info(f"Search for '{query}' returned {len(results)} results")
-                    return json.dumps(results, indent=2)
+                    return dumps_result(results, indent=True)
                 else:
                     error_msg = f"Search API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({"error": error_msg})
+                    return dumps_result({"error": error_msg})
 
         except Exception as e:
             logger.error(f"Search API call failed: {e}", exc_info=True)
-            return json.dumps({"error": str(e)})
+            return dumps_result({"error": str(e)})
 
     @kernel_function(
         description=(
@@ -152,7 +174,7 @@ class ConciergeAPIClientPlugin:
             normalized_id = self.normalize_srm_id(srm_id)
             logger.info(f"Normalized '{srm_id}' to '{normalized_id}'")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/api/concierge/get",
                     json={"srm_id": normalized_id}
@@ -161,16 +183,16 @@ class ConciergeAPIClientPlugin:
                 if response.status_code == 200:
                     data = response.json()
                     if data.get("error"):
-                        return json.dumps({"error": data["error"]})
-                    return json.dumps(data.get("srm", {}), indent=2)
+                        return dumps_result({"error": data["error"]})
+                    return dumps_result(data.get("srm", {}), indent=True)
                 else:
                     error_msg = f"Get API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({"error": error_msg})
+                    return dumps_result({"error": error_msg})
 
         except Exception as e:
             logger.error(f"Get API call failed: {e}", exc_info=True)
-            return json.dumps({"error": str(e)})
+            return dumps_result({"error": str(e)})
 
     @kernel_function(
         description=(
@@ -207,9 +229,9 @@ class ConciergeAPIClientPlugin:
             logger.info(f"Normalized '{srm_id}' to '{normalized_id}' for update")
 
             # Parse updates to dict for API
-            updates_dict = json.loads(updates)
+            updates_dict = orjson.loads(updates)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/api/concierge/update",
                     json={
@@ -221,23 +243,23 @@ class ConciergeAPIClientPlugin:
                 if response.status_code == 200:
                     data = response.json()
                     logger.info(f"Update SRM {srm_id}: success={data.get('success')}")
-                    return json.dumps(data, indent=2)
+                    return dumps_result(data, indent=True)
                 else:
                     error_msg = f"Update API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({
+                    return dumps_result({
                         "success": False,
                         "error": error_msg
                     })
 
-        except json.JSONDecodeError as e:
-            return json.dumps({
+        except orjson.JSONDecodeError as e:
+            return dumps_result({
                 "success": False,
                 "error": f"Invalid JSON in updates: {e}"
             })
         except Exception as e:
             logger.error(f"Update API call failed: {e}", exc_info=True)
-            return json.dumps({
+            return dumps_result({
                 "success": False,
                 "error": str(e)
             })
@@ -263,7 +285,7 @@ class ConciergeAPIClientPlugin:
             print("[*] Getting stats...", flush=True)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.base_url}/api/concierge/stats"
                 )
@@ -271,15 +293,15 @@ class ConciergeAPIClientPlugin:
                 if response.status_code == 200:
                     data = response.json()
                     logger.info(f"Stats retrieved: {data.get('total_srms')} total, {data.get('temp_srms')} temp")
-                    return json.dumps(data, indent=2)
+                    return dumps_result(data, indent=True)
                 else:
                     error_msg = f"Stats API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({"error": error_msg})
+                    return dumps_result({"error": error_msg})
 
         except Exception as e:
             logger.error(f"Stats API call failed: {e}", exc_info=True)
-            return json.dumps({"error": str(e)})
+            return dumps_result({"error": str(e)})
 
     @kernel_function(
         description=(
@@ -313,10 +335,10 @@ class ConciergeAPIClientPlugin:
 
         try:
             # Parse to validate JSON
-            filter_data = json.loads(filter_json)
-            updates_data = json.loads(updates_json)
+            filter_data = orjson.loads(filter_json)
+            updates_data = orjson.loads(updates_json)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/api/concierge/batch/update",
                     json={
@@ -328,23 +350,23 @@ class ConciergeAPIClientPlugin:
                 if response.status_code == 200:
                     data = response.json()
                     logger.info(f"Batch update: {data.get('updated_count')} SRMs updated")
-                    return json.dumps(data, indent=2)
+                    return dumps_result(data, indent=True)
                 else:
                     error_msg = f"Batch update API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({
+                    return dumps_result({
                         "success": False,
                         "error": error_msg
                     })
 
-        except json.JSONDecodeError as e:
-            return json.dumps({
+        except orjson.JSONDecodeError as e:
+            return dumps_result({
                 "success": False,
                 "error": f"Invalid JSON: {e}"
             })
         except Exception as e:
             logger.error(f"Batch update API call failed: {e}", exc_info=True)
-            return json.dumps({
+            return dumps_result({
                 "success": False,
                 "error": str(e)
             })
@@ -369,9 +391,9 @@ class ConciergeAPIClientPlugin:
             print("[*] Creating temp SRM...", flush=True)
 
         try:
-            srm_data = json.loads(srm_data_json)
+            srm_data = orjson.loads(srm_data_json)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/api/concierge/temp/create",
                     json=srm_data
@@ -380,15 +402,15 @@ class ConciergeAPIClientPlugin:
                 if response.status_code == 200:
                     data = response.json()
                     logger.info(f"Created temp SRM: {data.get('srm_id')}")
-                    return json.dumps(data, indent=2)
+                    return dumps_result(data, indent=True)
                 else:
                     error_msg = f"Temp create API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({"success": False, "error": error_msg})
+                    return dumps_result({"success": False, "error": error_msg})
 
         except Exception as e:
             logger.error(f"Temp create API call failed: {e}", exc_info=True)
-            return json.dumps({"success": False, "error": str(e)})
+            return dumps_result({"success": False, "error": str(e)})
 
     @kernel_function(
         description="List all temporary SRMs",
@@ -403,22 +425,22 @@ class ConciergeAPIClientPlugin:
             print("[*] Listing temp SRMs...", flush=True)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.base_url}/api/concierge/temp/list"
                 )
 
                 if response.status_code == 200:
                     data = response.json()
-                    return json.dumps(data, indent=2)
+                    return dumps_result(data, indent=True)
                 else:
                     error_msg = f"Temp list API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({"temp_srms": []})
+                    return dumps_result({"temp_srms": []})
 
         except Exception as e:
             logger.error(f"Temp list API call failed: {e}", exc_info=True)
-            return json.dumps({"temp_srms": []})
+            return dumps_result({"temp_srms": []})
 
     @kernel_function(
         description="Delete temporary SRM by ID",
@@ -436,7 +458,7 @@ class ConciergeAPIClientPlugin:
             print("[*] Deleting temp SRM...", flush=True)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/api/concierge/temp/delete",
                     json={"srm_id": srm_id}
@@ -445,12 +467,12 @@ class ConciergeAPIClientPlugin:
                 if response.status_code == 200:
                     data = response.json()
                     logger.info(f"Deleted temp SRM: {srm_id}")
-                    return json.dumps(data, indent=2)
+                    return dumps_result(data, indent=True)
                 else:
                     error_msg = f"Temp delete API returned status {response.status_code}"
                     logger.error(error_msg)
-                    return json.dumps({"success": False, "error": error_msg})
+                    return dumps_result({"success": False, "error": error_msg})
 
         except Exception as e:
             logger.error(f"Temp delete API call failed: {e}", exc_info=True)
-            return json.dumps({"success": False, "error": str(e)})
+            return dumps_result({"success": False, "error": str(e)})
@@ -4,18 +4,22 @@ SRM Metadata Plugin for maintainer operations.
 Provides functions for updating SRM metadata through vector store.
 """
 
-import json
 import logging
 from typing import Annotated
 
+import orjson
 from semantic_kernel.functions import kernel_function
 
 from src.memory.vector_store_base import VectorStoreBase
 from src.models.srm_record import SRMRecord
+from src.utils.json_output import dumps_result
 
 
 logger = logging.getLogger(__name__)
 
+# Metadata fields maintainers may change through this plugin
+UPDATABLE_FIELDS = frozenset({"owner_notes", "hidden_notes"})
+
 
 class SRMMetadataPlugin:
     """
@@ -60,12 +64,12 @@ class SRMMetadataPlugin:
         """
         try:
             # Parse updates
-            update_data = json.loads(updates)
+            update_data = orjson.loads(updates)
 
             # Get current record
             record = await self.vector_store.get_by_id(srm_id)
             if not record:
-                return json.dumps({
+                return dumps_result({
                     "success": False,
                     "error": f"SRM {srm_id} not found"
                 })
@@ -76,7 +80,6 @@ class SRMMetadataPlugin:
                 before_state[field] = getattr(record, field, "")
 
             # Apply updates (only allow specific fields)
-            UPDATABLE_FIELDS = {"owner_notes", "hidden_notes"}
             for field, value in update_data.items():
                 if field not in UPDATABLE_FIELDS:
                     logger.warning(f"Attempted to update non-updatable field: {field}")
@@ -104,16 +107,16 @@ class SRMMetadataPlugin:
             }
 
             logger.info(f"Updated SRM {srm_id}: {list(update_data.keys())}")
-            return json.dumps(response, indent=2)
+            return dumps_result(response, indent=True)
 
-        except json.JSONDecodeError as e:
-            return json.dumps({
+        except orjson.JSONDecodeError as e:
+            return dumps_result({
                 "success": False,
                 "error": f"Invalid JSON in updates: {e}"
             })
         except Exception as e:
             logger.error(f"Error updating SRM {srm_id}: {e}", exc_info=True)
-            return json.dumps({
+            return dumps_result({
                 "success": False,
                 "error": f"Update failed: {e}"
             })
@@ -148,11 +151,11 @@ class SRMMetadataPlugin:
                     "score": result.score
                 })
 
-            return json.dumps(results, indent=2)
+            return dumps_result(results, indent=True)
 
         except Exception as e:
             logger.error(f"Search error: {e}", exc_info=True)
-            return json.dumps([])
+            return dumps_result([])
 
     @kernel_function(
         description="Get specific SRM by ID",
@@ -174,12 +177,12 @@ class SRMMetadataPlugin:
         try:
             record = await self.vector_store.get_by_id(srm_id)
             if not record:
-                return json.dumps({
+                return dumps_result({
                     "success": False,
                     "error": f"SRM {srm_id} not found"
                 })
 
-            return json.dumps({
+            return dumps_result({
                 "success": True,
                 "srm": {
                     "id": record.id,
@@ -189,11 +192,11 @@ class SRMMetadataPlugin:
                     "owner_notes": record.owner_notes,
                     "hidden_notes": record.hidden_notes
                 }
-            }, indent=2)
+            }, indent=True)
 
         except Exception as e:
             logger.error(f"Get by ID error: {e}", exc_info=True)
-            return json.dumps({
+            return dumps_result({
                 "success": False,
                 "error": str(e)
             })
@@ -219,8 +222,8 @@ class SRMMetadataPlugin:
         """
         try:
             # Parse inputs
-            filter_data = json.loads(filter_json)
-            update_data = json.loads(updates)
+            filter_data = orjson.loads(filter_json)
+            update_data = orjson.loads(updates)
 
             # Get all SRMs (search with broad query)
             all_results = []
@@ -244,40 +247,49 @@ class SRMMetadataPlugin:
             # Update records (max 20 for safety)
             MAX_BATCH_SIZE = 20
             if len(matching_records) > MAX_BATCH_SIZE:
-                return json.dumps({
+                return dumps_result({
                     "success": False,
                     "error": f"Too many matches ({len(matching_records)}). Max batch size is {MAX_BATCH_SIZE}."
                 })
 
             # Apply updates
-            UPDATABLE_FIELDS = {"owner_notes", "hidden_notes"}
             updated_ids = []
             failures = []
 
+            updated_records = []
             for record in matching_records:
                 try:
                     for field, value in update_data.items():
                         if field in UPDATABLE_FIELDS:
                             setattr(record, field, value)
-
-                    await self.vector_store.upsert([record])
-                    updated_ids.append(record.id)
+                    updated_records.append(record)
                 except Exception as e:
                     failures.append({
                         "srm_id": record.id,
                         "error": str(e)
                     })
 
-            return json.dumps({
+            # Write all updated records back in a single upsert
+            if updated_records:
+                try:
+                    await self.vector_store.upsert(updated_records)
+                    updated_ids = [record.id for record in updated_records]
+                except Exception as e:
+                    failures.extend(
+                        {"srm_id": record.id, "error": str(e)}
+                        for record in updated_records
+                    )
+
+            return dumps_result({
                 "success": True,
                 "updated_count": len(updated_ids),
                 "updated_ids": updated_ids,
                 "failures": failures
-            }, indent=2)
+            }, indent=True)
 
         except Exception as e:
             logger.error(f"Batch update error: {e}", exc_info=True)
-            return json.dumps({
+            return dumps_result({
                 "success": False,
                 "error": str(e)
             })
@@ -304,7 +316,7 @@ class SRMMetadataPlugin:
         """
         # This is a placeholder - actual implementation is in the API endpoint
         # since it needs access to app.state.temp_srms
-        return json.dumps({
+        return dumps_result({
             "success": False,
             "error": "create_temp_srm must be called via API endpoint"
         })
@@ -13,6 +13,8 @@ from semantic_kernel.processes.kernel_process import (
 )
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
+from src.models.process_state import ResultContainer
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -51,7 +53,7 @@ class AnswerStep(KernelProcessStep):
         ranked_candidates = input_data.get('ranked_candidates', [])
         session_id = input_data.get('session_id', '')
         user_query = input_data.get('user_query', '')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         
         logger.info("Formatting answer", extra={"session_id": session_id, "has_recommendation": selected_srm is not None})
         
@@ -63,10 +65,10 @@ class AnswerStep(KernelProcessStep):
             logger.info("No recommendation found, using fallback", extra={"session_id": session_id})
             
             # Store result in container for entry point to retrieve
-            result_container['final_answer'] = answer
-            result_container['selected_id'] = None
-            result_container['confidence'] = confidence
-            result_container['retrieved_context'] = []  # No context for fallback
+            result_container.final_answer = answer
+            result_container.selected_id = None
+            result_container.confidence = confidence
+            result_container.retrieved_context = []  # No context for fallback
             
             # Emit public event with answer data
             await context.emit_event(
@@ -89,11 +91,11 @@ class AnswerStep(KernelProcessStep):
         logger.info("Answer formatted successfully", extra={"session_id": session_id, "srm_id": selected_srm.get('srm_id')})
 
         # Store result in container for entry point to retrieve
-        result_container['final_answer'] = answer
-        result_container['selected_id'] = selected_srm.get('srm_id')
-        result_container['confidence'] = confidence
+        result_container.final_answer = answer
+        result_container.selected_id = selected_srm.get('srm_id')
+        result_container.confidence = confidence
         # Store retrieved context for evaluation (top 3 ranked candidates)
-        result_container['retrieved_context'] = ranked_candidates if ranked_candidates else [selected_srm] + alternatives
+        result_container.retrieved_context = ranked_candidates if ranked_candidates else [selected_srm] + alternatives
         
         # Emit public event with answer data
         await context.emit_event(
@@ -129,7 +131,7 @@ class AnswerStep(KernelProcessStep):
         # Include SRM_ID in the response for frontend tracking
         srm_id = selected.get('srm_id', '')
         
-        answer = f"""## Recommended SRM: {selected['name']}
+        parts = [f"""## Recommended SRM: {selected['name']}
 
 **SRM ID:** {srm_id}
 
@@ -138,32 +140,32 @@ class AnswerStep(KernelProcessStep):
 **Use Case:** {selected['use_case']}
 
 **Owning Team:** {selected['owning_team']}
-"""
+"""]
         
         # Add URL if available
         if selected.get('url'):
-            answer += f"\n**URL:** {selected['url']}\n"
+            parts.append(f"\n**URL:** {selected['url']}\n")
         
         # Add Owner Notes if available
         if selected.get('owner_notes'):
-            answer += f"\n**Owner Notes:** {selected['owner_notes']}\n"
+            parts.append(f"\n**Owner Notes:** {selected['owner_notes']}\n")
         
         # Add Hidden Notes if available (for internal reference)
         if selected.get('hidden_notes'):
-            answer += f"\n**Hidden Notes:** {selected['hidden_notes']}\n"
+            parts.append(f"\n**Hidden Notes:** {selected['hidden_notes']}\n")
         
         # Always show 2 alternative options
         if alternatives:
-            answer += "\n### Alternative Options:\n\n"
+            parts.append("\n### Alternative Options:\n\n")
             for i, alt in enumerate(alternatives[:2], 1):
                 alt_id = alt.get('srm_id', '')
-                answer += f"{i}. **{alt['name']}** (ID: {alt_id}, {alt['category']}) - {alt['use_case']}\n"
+                parts.append(f"{i}. **{alt['name']}** (ID: {alt_id}, {alt['category']}) - {alt['use_case']}\n")
                 if alt.get('url'):
-                    answer += f"   **URL:** {alt['url']}\n"
+                    parts.append(f"   **URL:** {alt['url']}\n")
         
-        answer += "\n---\n*If this doesn't match your need, please provide more details and I'll search again.*"
+        parts.append("\n---\n*If this doesn't match your need, please provide more details and I'll search again.*")
         
-        return answer
+        return "".join(parts)
     
     def _format_fallback(self) -> str:
         '''
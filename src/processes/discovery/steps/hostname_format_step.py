@@ -13,6 +13,8 @@ from semantic_kernel.processes.kernel_process import (
 )
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
+from src.models.process_state import ResultContainer
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -46,7 +48,7 @@ class HostnameFormatStep(KernelProcessStep):
             input_data: Dictionary containing lookup results and session_id
         '''
         session_id = input_data.get('session_id', '')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         
         # Determine which type of result to format based on what's in input_data
         if 'hostname_record' in input_data:
@@ -64,7 +66,7 @@ class HostnameFormatStep(KernelProcessStep):
         context: KernelProcessStepContext,
         input_data: dict,
         session_id: str,
-        result_container: dict,
+        result_container: ResultContainer,
     ) -> None:
         '''
         Format a single hostname match for display.
@@ -82,9 +84,9 @@ class HostnameFormatStep(KernelProcessStep):
         response = self._format_hostname_details(hostname_record)
         
         # Store result in container for entry point to retrieve
-        result_container['answer'] = response
-        result_container['hostname'] = hostname_record.hostname
-        result_container['application_name'] = hostname_record.application_name
+        result_container.answer = response
+        result_container.hostname = hostname_record.hostname
+        result_container.application_name = hostname_record.application_name
         
         # Emit completion event with answer data
         await context.emit_event(
@@ -103,7 +105,7 @@ class HostnameFormatStep(KernelProcessStep):
         context: KernelProcessStepContext,
         input_data: dict,
         session_id: str,
-        result_container: dict,
+        result_container: ResultContainer,
     ) -> None:
         '''
         Format multiple hostname matches for display.
@@ -119,25 +121,33 @@ class HostnameFormatStep(KernelProcessStep):
         
         logger.info("Formatting multiple matches", extra={"session_id": session_id, "match_count": len(hostname_records), "is_partial": is_partial})
         
-        # Format the response based on whether matches are partial or exact
+        # Format the response based on whether matches are partial or exact;
+        # collect the parts and join once, since the match list can be long
         if is_partial:
-            response = f"**Partial matches found for '{user_query}' ({len(hostname_records)} results)**\n\n"
-            response += "Here are the matching hostnames:\n\n"
+            parts = [
+                f"**Partial matches found for '{user_query}' ({len(hostname_records)} results)**\n\n",
+                "Here are the matching hostnames:\n\n",
+            ]
         else:
-            response = f"**Multiple matches found for '{user_query}' ({len(hostname_records)} results)**\n\n"
-            response += "Please be more specific. Here are the matching hostnames:\n\n"
-        
-        for record in hostname_records:
-            response += f"- **{record.hostname}** ({record.application_name}) - {record.maintenance_window}\n"
+            parts = [
+                f"**Multiple matches found for '{user_query}' ({len(hostname_records)} results)**\n\n",
+                "Please be more specific. Here are the matching hostnames:\n\n",
+            ]
+        
+        parts.extend(
+            f"- **{record.hostname}** ({record.application_name}) - {record.maintenance_window}\n"
+            for record in hostname_records
+        )
         
         if is_partial:
-            response += "\n*Tip: Try using the exact hostname for best results.*"
+            parts.append("\n*Tip: Try using the exact hostname for best results.*")
         else:
-            response += "\n*Tip: Use the exact hostname for detailed information.*"
+            parts.append("\n*Tip: Use the exact hostname for detailed information.*")
+        response = "".join(parts)
         
         # Store result in container for entry point to retrieve
-        result_container['answer'] = response
-        result_container['match_count'] = len(hostname_records)
+        result_container.answer = response
+        result_container.match_count = len(hostname_records)
         
         # Emit completion event with answer data
         await context.emit_event(
@@ -155,7 +165,7 @@ class HostnameFormatStep(KernelProcessStep):
         context: KernelProcessStepContext,
         input_data: dict,
         session_id: str,
-        result_container: dict,
+        result_container: ResultContainer,
     ) -> None:
         '''
         Format a no match response.
@@ -178,8 +188,8 @@ class HostnameFormatStep(KernelProcessStep):
         response += "*Note: The lookup command requires exact hostname matches.*"
         
         # Store result in container for entry point to retrieve
-        result_container['answer'] = response
-        result_container['match_count'] = 0
+        result_container.answer = response
+        result_container.match_count = 0
         
         # Emit completion event with answer data
         await context.emit_event(
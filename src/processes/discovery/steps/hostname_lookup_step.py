@@ -5,6 +5,7 @@ Hostname lookup step - Search for hostname in Azure AI Search indexes.
 import logging
 import os
 from enum import Enum
+from functools import lru_cache
 
 from azure.core.credentials import AzureKeyCredential
 from azure.search.documents import SearchClient
@@ -14,12 +15,49 @@ from semantic_kernel.processes.kernel_process import KernelProcessStep, KernelPr
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
 from src.models.hostname_record import HostnameRecord
+from src.models.process_state import ResultContainer
 
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _create_search_clients(
+    endpoint: str,
+    api_key: str,
+    machines_index: str,
+    team_index: str
+) -> tuple[SearchClient, SearchClient]:
+    '''
+    Create Azure AI Search clients for both indexes, once per configuration.
+
+    Steps are instantiated per process run, so caching here lets every
+    lookup reuse the same clients and their pooled, already-TLS'd connections.
+
+    Args:
+        endpoint: Azure AI Search endpoint
+        api_key: Azure AI Search API key
+        machines_index: Name of the app_machines index
+        team_index: Name of the app_team_index index
+
+    Returns:
+        Tuple of (machines_client, team_client)
+    '''
+    credential = AzureKeyCredential(api_key)
+    machines_client = SearchClient(
+        endpoint=endpoint,
+        index_name=machines_index,
+        credential=credential
+    )
+    team_client = SearchClient(
+        endpoint=endpoint,
+        index_name=team_index,
+        credential=credential
+    )
+    return machines_client, team_client
+
+
 @kernel_process_step_metadata("HostnameLookupStep.V1")
 class HostnameLookupStep(KernelProcessStep):
     '''
@@ -38,7 +76,7 @@ class HostnameLookupStep(KernelProcessStep):
     
     def _get_search_clients(self):
         '''
-        Create and return Azure AI Search clients for both indexes.
+        Return the shared Azure AI Search clients for both indexes.
         
         Returns:
             Tuple of (machines_client, team_client)
@@ -57,20 +95,7 @@ class HostnameLookupStep(KernelProcessStep):
         machines_index = os.getenv('AZURE_AI_SEARCH_APP_MACHINES_INDEX', 'app_machines')
         team_index = os.getenv('AZURE_AI_SEARCH_APP_TEAM_INDEX', 'app_team_index')
         
-        # Create search clients for both indexes
-        machines_client = SearchClient(
-            endpoint=endpoint,
-            index_name=machines_index,
-            credential=AzureKeyCredential(api_key)
-        )
-        
-        team_client = SearchClient(
-            endpoint=endpoint,
-            index_name=team_index,
-            credential=AzureKeyCredential(api_key)
-        )
-        
-        return machines_client, team_client
+        return _create_search_clients(endpoint, api_key, machines_index, team_index)
     
     @kernel_function(name="lookup_hostname")
     async def lookup_hostname(
@@ -87,7 +112,7 @@ class HostnameLookupStep(KernelProcessStep):
         '''
         user_query = input_data.get('user_query', '').strip()
         session_id = input_data.get('session_id', '')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         
         logger.info("Looking up hostname", extra={"session_id": session_id, "hostname": user_query})
         
@@ -14,6 +14,8 @@ from semantic_kernel.processes.kernel_process import (
 )
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
+from src.models.process_state import ResultContainer
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -51,7 +53,7 @@ class HostnameValidationStep(KernelProcessStep):
         user_query = input_data.get('user_query', '').strip()
         session_id = input_data.get('session_id', '')
         kernel = input_data.get('kernel')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         
         logger.info("Validating hostname query", extra={"session_id": session_id, "query": user_query})
         
@@ -65,8 +67,8 @@ class HostnameValidationStep(KernelProcessStep):
             rejection_message = self._format_rejection_message(rejection_reason)
             
             # Store result in container for entry point to retrieve
-            result_container['rejection_message'] = rejection_message
-            result_container['rejection_reason'] = rejection_reason
+            result_container.rejection_message = rejection_message
+            result_container.rejection_reason = rejection_reason
             
             # Emit rejection event with answer data
             await context.emit_event(
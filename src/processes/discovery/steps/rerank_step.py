@@ -2,15 +2,18 @@
 Rerank step - Use LLM to semantically score and select the best SRM recommendations.
 '''
 
-import json
 import logging
 from enum import Enum
 
+import orjson
+
 from semantic_kernel import Kernel
 from semantic_kernel.functions import kernel_function
 from semantic_kernel.processes.kernel_process import KernelProcessStep, KernelProcessStepContext
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
+from src.models.process_state import ResultContainer
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -50,7 +53,7 @@ class RerankStep(KernelProcessStep):
         session_id = input_data.get('session_id', '')
         vector_store = input_data.get('vector_store')
         kernel = input_data.get('kernel')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         feedback_processor = input_data.get('feedback_processor')
         
         logger.info("Reranking candidates", extra={"session_id": session_id, "candidate_count": len(candidates) if candidates else 0})
@@ -140,12 +143,13 @@ class RerankStep(KernelProcessStep):
             List of candidates with LLM scores
         '''
         # Format candidates for LLM
-        candidates_text = ""
-        for i, candidate in enumerate(candidates):
-            candidates_text += f"\n[{i}] Name: {candidate['name']}\n"
-            candidates_text += f"    Category: {candidate['category']}\n"
-            candidates_text += f"    Use Case: {candidate['use_case']}\n"
-            candidates_text += f"    Team: {candidate['owning_team']}\n"
+        candidates_text = "".join(
+            f"\n[{i}] Name: {candidate['name']}\n"
+            f"    Category: {candidate['category']}\n"
+            f"    Use Case: {candidate['use_case']}\n"
+            f"    Team: {candidate['owning_team']}\n"
+            for i, candidate in enumerate(candidates)
+        )
         
         # Get the reranking plugin
         rerank_plugin = kernel.get_plugin("semantic_reranker")
@@ -163,7 +167,7 @@ class RerankStep(KernelProcessStep):
             logger.debug("LLM reranking response received", extra={"response_preview": result_text[:200]})
             
             # Parse JSON response
-            rankings_data = json.loads(result_text)
+            rankings_data = orjson.loads(result_text)
             rankings = rankings_data.get('rankings', [])
             
             # Apply LLM scores to candidates
@@ -218,8 +222,8 @@ class RerankStep(KernelProcessStep):
                 candidate['feedback_adjusted'] = True
                 candidate['adjustment_type'] = 'negative'
                 logger.debug(
-                    f"Applied negative feedback penalty to {candidate.get('name', 'unknown')}: "
-                    f"-{penalty:.1f} points"
+                    "Applied negative feedback penalty to %s: -%.1f points",
+                    candidate.get('name', 'unknown'), penalty
                 )
             
             # Apply boosts for positive feedback
@@ -230,8 +234,8 @@ class RerankStep(KernelProcessStep):
                 candidate['feedback_adjusted'] = True
                 candidate['adjustment_type'] = 'positive'
                 logger.debug(
-                    f"Applied positive feedback boost to {candidate.get('name', 'unknown')}: "
-                    f"+{boost:.1f} points"
+                    "Applied positive feedback boost to %s: +%.1f points",
+                    candidate.get('name', 'unknown'), boost
                 )
         
         return candidates
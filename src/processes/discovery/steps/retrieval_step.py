@@ -10,6 +10,7 @@ from semantic_kernel.processes.kernel_process import KernelProcessStep, KernelPr
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
 from src.memory.vector_store_base import VectorStoreBase
+from src.models.process_state import ResultContainer
 
 
 # Configure logger
@@ -51,7 +52,7 @@ class RetrievalStep(KernelProcessStep):
         session_id = input_data.get('session_id', '')
         vector_store = input_data.get('vector_store')
         kernel = input_data.get('kernel')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         
         logger.info("Searching for SRM candidates", extra={"session_id": session_id, "query": user_query, "key_terms": key_terms})
         
@@ -62,9 +63,9 @@ class RetrievalStep(KernelProcessStep):
         # Perform vector search using vector_store from input_data
         top_k = 5  # Get top 5 candidates for reranking
         try:
-            logger.info(f"Calling vector store search: query='{search_query}', top_k={top_k}", extra={"session_id": session_id})
+            logger.info("Calling vector store search: query='%s', top_k=%d", search_query, top_k, extra={"session_id": session_id})
             results = await vector_store.search(search_query, top_k=top_k)
-            logger.info(f"Search returned, type: {type(results)}", extra={"session_id": session_id})
+            logger.info("Search returned, type: %s", type(results), extra={"session_id": session_id})
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -82,7 +83,7 @@ class RetrievalStep(KernelProcessStep):
         result_count = 0
         async for result in results:
             result_count += 1
-            logger.debug(f"Processing result {result_count}, score: {result.score}", extra={"session_id": session_id})
+            logger.debug("Processing result %d, score: %s", result_count, result.score, extra={"session_id": session_id})
             record = result.record
             
             # Handle team-based results from Azure AI Search
@@ -18,6 +18,8 @@ from semantic_kernel.processes.kernel_process import (
 )
 from semantic_kernel.processes.kernel_process.kernel_process_step_metadata import kernel_process_step_metadata
 
+from src.models.process_state import ResultContainer
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -28,6 +30,9 @@ MAX_LENGTH = 500
 MAX_SPECIAL_CHAR_RATIO = 0.3
 MAX_REPETITION_COUNT = 5
 
+# A character repeated more than MAX_REPETITION_COUNT times in a row (e.g. "aaaaaaa")
+REPEATED_CHAR_RE = re.compile(r'(.)\1{' + str(MAX_REPETITION_COUNT) + ',}')
+
 
 @kernel_process_step_metadata("ValidationStep.V1")
 class ValidationStep(KernelProcessStep):
@@ -64,7 +69,7 @@ class ValidationStep(KernelProcessStep):
         vector_store = input_data.get('vector_store')
         session_id = input_data.get('session_id', '')
         kernel = input_data.get('kernel')
-        result_container = input_data.get('result_container', {})
+        result_container = input_data.get('result_container') or ResultContainer()
         
         logger.info("Validating input", extra={"session_id": session_id, "query_length": len(user_query)})
         
@@ -88,8 +93,8 @@ class ValidationStep(KernelProcessStep):
             )
             
             # Store result in container for entry point to retrieve
-            result_container['rejection_message'] = rejection_message
-            result_container['rejection_reason'] = rejection_reason
+            result_container.rejection_message = rejection_message
+            result_container.rejection_reason = rejection_reason
             
             # Emit rejection event with business data only
             await context.emit_event(
@@ -186,7 +191,7 @@ class ValidationStep(KernelProcessStep):
             True if excessive repetition detected
         '''
         # Check for repeated characters (e.g., "aaaaaaa")
-        if re.search(r'(.)\1{' + str(MAX_REPETITION_COUNT) + ',}', text):
+        if REPEATED_CHAR_RE.search(text):
             return True
         
         # Check for repeated words (e.g., "test test test test test test")
@@ -10,7 +10,7 @@ import logging
 import shutil
 from pathlib import Path
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 
 from semantic_kernel import Kernel
 from semantic_kernel.contents import ChatHistory, ChatMessageContent
@@ -334,7 +334,7 @@ Provide a concise summary in 2-3 paragraphs that captures the essential context.
                 # Save metadata
                 metadata = {
                     'type': 'metadata',
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
                     'message_count': len(self.history.messages),
                     'token_count': self.count_tokens()
                 }
@@ -346,7 +346,7 @@ Provide a concise summary in 2-3 paragraphs that captures the essential context.
                         'type': 'message',
                         'role': message.role.value if hasattr(message.role, 'value') else str(message.role),
                         'content': str(message.content) if message.content else "",
-                        'timestamp': datetime.utcnow().isoformat()
+                        'timestamp': datetime.now(timezone.utc).isoformat()
                     }
                     f.write(json.dumps(message_dict, ensure_ascii=False) + '\n')
 
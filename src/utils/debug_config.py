@@ -4,9 +4,16 @@ Debug configuration module for controlling verbose output.
 This module provides a centralized way to manage debug mode across the application.
 '''
 
+import os
+
+
+# Debug mode fixed at import time from the DEBUG environment variable.
+# Hot paths test this constant before building debug messages so that
+# nothing is formatted when debug output is off.
+DEBUG = os.getenv('DEBUG', '').strip().lower() in ('1', 'true', 'yes', 'on')
 
 # Global debug state
-_DEBUG_ENABLED = False
+_DEBUG_ENABLED = DEBUG
 
 
 def set_debug(enabled: bool) -> None:
@@ -0,0 +1,80 @@
+'''
+Coalesce concurrent query embeddings into batched embedding requests.
+
+When many searches run at once, each would otherwise send its own
+single-text embedding request. The batcher sends queries that arrive
+while earlier requests are still in flight together in one request.
+'''
+
+import asyncio
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+
+
+class QueryEmbeddingBatcher:
+    '''
+    Batches concurrent single-text embedding calls.
+
+    A query arriving while fewer than max_in_flight requests are running is
+    sent right away, so an idle service adds no latency. Queries arriving
+    while all request slots are busy queue up and go out together, up to
+    max_batch texts per request, as soon as a slot frees up.
+    '''
+
+    def __init__(
+        self,
+        embedding_generator: EmbeddingGeneratorBase,
+        max_batch: int = 16,
+        max_in_flight: int = 4
+    ):
+        '''
+        Initialize the batcher.
+
+        Args:
+            embedding_generator: Embedding service that embeds a list of texts
+            max_batch: Maximum texts per embedding request
+            max_in_flight: Maximum concurrent embedding requests
+        '''
+        self.embedding_generator = embedding_generator
+        self.max_batch = max_batch
+        self.max_in_flight = max_in_flight
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._workers: set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        '''
+        Embed a single text, sharing a request with concurrent callers.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding as a list of floats
+        '''
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+
+        if len(self._workers) < self.max_in_flight:
+            worker = asyncio.create_task(self._drain())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+        return await future
+
+    async def _drain(self) -> None:
+        '''Send pending texts in batches until none are left.'''
+        while self._pending:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+
+            try:
+                embeddings = await self.embedding_generator.generate_embeddings([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding))
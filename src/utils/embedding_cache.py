@@ -0,0 +1,272 @@
+'''
+Persistent on-disk cache for text embeddings.
+
+Embeddings are keyed by a 128-bit BLAKE2b hash of the embedding model ID
+and the text, so unchanged SRM records are not re-embedded on every startup.
+'''
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import Awaitable, Callable, Sequence
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    '''
+    Content-addressed embedding cache backed by two files.
+
+    - vectors.bin: vectors, one row per cached text
+    - index.json: model ID, key format, storage dtype, dimensions, a
+      digest of vectors.bin and a {hash: row} index
+
+    Vectors are stored as float16 by default, halving the cache size and
+    the bytes read at startup; they are returned upcast to float32. The
+    whole cache is discarded when the model ID, storage dtype or the
+    embedding dimensions change, and rows for texts that are no longer
+    requested are dropped.
+
+    Several server workers may share one cache directory, so both files
+    are replaced atomically and any read problem (missing, partial or
+    mismatched files) is treated as a cache miss.
+    '''
+
+    VECTORS_FILE = "vectors.bin"
+    INDEX_FILE = "index.json"
+    SUPPORTED_DTYPES = ("float16", "float32")
+    KEY_FORMAT = "blake2b-128"
+
+    def __init__(self, cache_dir: str | Path = "cache/embeddings", dtype: str = "float16"):
+        '''
+        Initialize the embedding cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            dtype: Storage precision, "float16" (default) or "float32"
+
+        Raises:
+            ValueError: If dtype is not supported
+        '''
+        if dtype not in self.SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {self.SUPPORTED_DTYPES}, got {dtype}")
+
+        self.dtype = np.dtype(dtype)
+        self.cache_dir = Path(cache_dir)
+        self.vectors_file = self.cache_dir / self.VECTORS_FILE
+        self.index_file = self.cache_dir / self.INDEX_FILE
+
+    @staticmethod
+    def make_key(model_id: str, text: str) -> str:
+        '''
+        Build the cache key for a text.
+
+        Args:
+            model_id: Embedding model/deployment identifier
+            text: Text being embedded
+
+        Returns:
+            Hex 16-byte BLAKE2b digest of model ID and text
+        '''
+        return hashlib.blake2b((model_id + "\x00" + text).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load_index(self, model_id: str) -> dict:
+        '''Load the index, returning an empty one if missing, unreadable or stale.'''
+        empty = self._empty_index(model_id)
+
+        if not self.index_file.exists() or not self.vectors_file.exists():
+            return empty
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache index: {e}")
+            return empty
+
+        if index.get("model_id") != model_id:
+            logger.info("Embedding model changed, discarding embedding cache")
+            return empty
+
+        if index.get("key_format") != self.KEY_FORMAT:
+            logger.info("Embedding cache key format changed, discarding embedding cache")
+            return empty
+
+        if index.get("dtype") != self.dtype.name:
+            logger.info("Embedding cache dtype changed, discarding embedding cache")
+            return empty
+
+        return index
+
+    def _empty_index(self, model_id: str) -> dict:
+        '''Create an index with no cached rows.'''
+        return {
+            "model_id": model_id,
+            "key_format": self.KEY_FORMAT,
+            "dtype": self.dtype.name,
+            "dimensions": None,
+            "vectors_digest": None,
+            "rows": {}
+        }
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        '''Hex 16-byte BLAKE2b digest of the vectors file contents.'''
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _read_vectors(self, index: dict) -> np.ndarray:
+        '''
+        Read the vectors described by an index as a (rows, dimensions) float32 array.
+
+        Raises:
+            ValueError: If the vectors file does not match the index (e.g. it
+                        was replaced by another worker after the index was read)
+        '''
+        row_count = len(index["rows"])
+        if row_count == 0:
+            return np.empty((0, index["dimensions"] or 0), dtype=np.float32)
+
+        with open(self.vectors_file, 'rb') as f:
+            data = f.read()
+        if self._digest(data) != index.get("vectors_digest"):
+            raise ValueError("vectors do not match index")
+        stored = np.frombuffer(data, dtype=self.dtype).reshape(row_count, index["dimensions"])
+        return stored.astype(np.float32)
+
+    def _replace_file(self, path: Path, data: bytes) -> None:
+        '''Write data to a temporary file in the cache directory and move it over path.'''
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+    def _write(self, index: dict, vectors: np.ndarray) -> None:
+        '''
+        Replace both cache files with the given index and vectors.
+
+        Readers see either the old or the new version of each file, and the
+        digest in the index rejects an index paired with the other version
+        of vectors.bin.
+        '''
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data = np.ascontiguousarray(vectors, dtype=self.dtype).tobytes()
+        index["vectors_digest"] = self._digest(data)
+        self._replace_file(self.vectors_file, data)
+        self._replace_file(self.index_file, json.dumps(index).encode('utf-8'))
+
+    @staticmethod
+    async def _embed(
+        pending: dict[str, str],
+        embed_fn: Callable[[list[str]], Awaitable[Sequence[Sequence[float] | None]]]
+    ) -> dict[str, Sequence[float]]:
+        '''Embed {key: text} pairs, keeping only the texts that were embedded.'''
+        if not pending:
+            return {}
+        embeddings = await embed_fn(list(pending.values()))
+        return {
+            key: embedding
+            for key, embedding in zip(pending, embeddings)
+            if embedding is not None
+        }
+
+    async def get_or_compute(
+        self,
+        texts: Sequence[str],
+        model_id: str,
+        embed_fn: Callable[[list[str]], Awaitable[Sequence[Sequence[float] | None]]]
+    ) -> list[list[float] | None]:
+        '''
+        Return embeddings for texts, computing only the ones not cached.
+
+        The cache is rewritten to hold only these texts, so callers pass the
+        whole catalog in one call.
+
+        Args:
+            texts: Texts to embed
+            model_id: Embedding model/deployment identifier
+            embed_fn: Async function embedding a list of texts, used for misses;
+                      may return None for a text it could not embed
+
+        Returns:
+            One embedding per input text, in input order (None, and nothing
+            cached, for texts embed_fn could not embed)
+        '''
+        if not texts:
+            return []
+
+        index = self._load_index(model_id)
+        try:
+            stored = self._read_vectors(index)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache vectors: {e}")
+            index = self._empty_index(model_id)
+            stored = self._read_vectors(index)
+
+        rows: dict[str, int] = index["rows"]
+        keys = [self.make_key(model_id, text) for text in texts]
+
+        # Embed each distinct missing text once
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in rows:
+                missing.setdefault(key, text)
+
+        computed = await self._embed(missing, embed_fn)
+        if computed:
+            dimensions = len(next(iter(computed.values())))
+
+            if index["dimensions"] not in (None, dimensions):
+                logger.info("Embedding dimensions changed, discarding embedding cache")
+                # The vectors just computed already have the new size; only
+                # the texts that were cached at the old size are embedded again
+                stale = {key: text for key, text in zip(keys, texts) if key in rows}
+                computed.update(await self._embed(stale, embed_fn))
+                index = self._empty_index(model_id)
+                rows = index["rows"]
+                stored = self._read_vectors(index)
+
+            index["dimensions"] = dimensions
+
+            # Round new vectors to the storage precision so a run that computes
+            # them returns the same values as later runs that read them back
+            new_vectors = np.asarray(list(computed.values()), dtype=np.float32)
+            new_vectors = new_vectors.astype(self.dtype).astype(np.float32)
+            computed = dict(zip(computed, new_vectors))
+
+        # Keep only the texts of this call, so rows for texts no longer
+        # requested (e.g. deleted SRMs) do not pile up in the cache files
+        used = [key for key in dict.fromkeys(keys) if key in computed or key in rows]
+        if computed or len(used) < len(rows):
+            if used:
+                all_vectors = np.stack([
+                    computed[key] if key in computed else stored[rows[key]]
+                    for key in used
+                ])
+            else:
+                all_vectors = np.empty((0, index["dimensions"] or 0), dtype=np.float32)
+            rows = {key: row for row, key in enumerate(used)}
+            index["rows"] = rows
+
+            try:
+                self._write(index, all_vectors)
+            except Exception as e:
+                # Never fail indexing because the cache could not be written
+                logger.warning(f"Failed to write embedding cache: {e}")
+        else:
+            all_vectors = stored
+
+        logger.info(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return [all_vectors[rows[key]].tolist() if key in rows else None for key in keys]
@@ -52,3 +52,9 @@ VALIDATION_SETTINGS = AzureChatPromptExecutionSettings(
         filters={"included_plugins": ["extraction"]}
     )
 )
+
+# Warmup settings - smallest possible completion, only opens the connection
+WARMUP_SETTINGS = AzureChatPromptExecutionSettings(
+    temperature=0.0,
+    max_tokens=1,
+)
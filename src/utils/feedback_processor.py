@@ -12,6 +12,9 @@ from src.memory.vector_store_base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Feedback types that count against the recommended SRM
+NEGATIVE_FEEDBACK_TYPES = frozenset({FeedbackType.NEGATIVE, FeedbackType.CORRECTION})
+
 
 class FeedbackProcessor:
     '''
@@ -53,36 +56,72 @@ class FeedbackProcessor:
         Returns:
             True if successfully processed, False otherwise
         '''
-        try:
-            logger.info(
-                f"Processing feedback {feedback.id} for session {feedback.session_id}"
-            )
-            
-            # Part 1 & 2: Lower relevance and add negative example for incorrect SRM
-            if feedback.incorrect_srm_id:
-                await self._apply_negative_feedback(
-                    srm_id=feedback.incorrect_srm_id,
-                    query=feedback.query,
-                    user_id=feedback.user_id
-                )
-            
-            # Part 3: Boost correct SRM if provided
-            if feedback.correct_srm_id and feedback.feedback_type == FeedbackType.CORRECTION:
-                await self._apply_positive_feedback(
-                    srm_id=feedback.correct_srm_id,
-                    query=feedback.query,
-                    user_id=feedback.user_id
-                )
+        results = await self.process_feedback_batch([feedback])
+        return results[0]
+    
+    async def process_feedback_batch(self, feedback_list: list[FeedbackRecord]) -> list[bool]:
+        '''
+        Process several feedback records, persisting their applied flags once.
+        
+        Each record is applied independently; a failure only affects that
+        record. The feedback file is rewritten a single time for the batch
+        instead of once per record.
+        
+        Args:
+            feedback_list: FeedbackRecords to process
             
+        Returns:
+            Success flag per record, in input order
+        '''
+        results = []
+        for feedback in feedback_list:
+            try:
+                await self._apply_feedback(feedback)
+                results.append(True)
+            except Exception as e:
+                logger.error(f"Error processing feedback {feedback.id}: {e}")
+                results.append(False)
+        
+        applied_ids = [
+            feedback.id for feedback, success in zip(feedback_list, results) if success
+        ]
+        try:
             # Mark feedback as applied
-            self.feedback_store.mark_as_applied(feedback.id)
-            
-            logger.info(f"Successfully processed feedback {feedback.id}")
-            return True
-            
+            self.feedback_store.mark_all_as_applied(applied_ids)
         except Exception as e:
-            logger.error(f"Error processing feedback {feedback.id}: {e}")
-            return False
+            logger.error(f"Error marking feedback as applied: {e}")
+            return [False] * len(feedback_list)
+        
+        for feedback_id in applied_ids:
+            logger.info(f"Successfully processed feedback {feedback_id}")
+        return results
+    
+    async def _apply_feedback(self, feedback: FeedbackRecord) -> None:
+        '''
+        Apply one feedback record to the vector store.
+        
+        Args:
+            feedback: FeedbackRecord to apply
+        '''
+        logger.info(
+            f"Processing feedback {feedback.id} for session {feedback.session_id}"
+        )
+        
+        # Part 1 & 2: Lower relevance and add negative example for incorrect SRM
+        if feedback.incorrect_srm_id:
+            await self._apply_negative_feedback(
+                srm_id=feedback.incorrect_srm_id,
+                query=feedback.query,
+                user_id=feedback.user_id
+            )
+        
+        # Part 3: Boost correct SRM if provided
+        if feedback.correct_srm_id and feedback.feedback_type == FeedbackType.CORRECTION:
+            await self._apply_positive_feedback(
+                srm_id=feedback.correct_srm_id,
+                query=feedback.query,
+                user_id=feedback.user_id
+            )
     
     async def _apply_negative_feedback(
         self, 
@@ -147,11 +186,7 @@ class FeedbackProcessor:
         
         logger.info(f"Processing {len(pending)} pending feedback records")
         
-        processed_count = 0
-        for feedback in pending:
-            success = await self.process_feedback(feedback)
-            if success:
-                processed_count += 1
+        processed_count = sum(await self.process_feedback_batch(pending))
         
         logger.info(f"Processed {processed_count}/{len(pending)} feedback records")
         return processed_count
@@ -174,7 +209,7 @@ class FeedbackProcessor:
         )
         negative_count = sum(
             1 for fb in feedback_list 
-            if fb.feedback_type in [FeedbackType.NEGATIVE, FeedbackType.CORRECTION] 
+            if fb.feedback_type in NEGATIVE_FEEDBACK_TYPES
             and fb.incorrect_srm_id == srm_id
         )
         
@@ -0,0 +1,25 @@
+'''
+JSON serialization for kernel function results.
+'''
+
+from typing import Any
+
+import orjson
+
+
+def dumps_result(payload: Any, indent: bool = False) -> str:
+    '''
+    Serialize a kernel function result with orjson.
+
+    Kernel functions return str, so the orjson bytes are decoded. numpy
+    scalars (e.g. search scores) are serialized as plain numbers.
+
+    Args:
+        payload: JSON-serializable result
+        indent: Indent with two spaces for readability
+
+    Returns:
+        JSON string
+    '''
+    option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(payload, option=option).decode()
@@ -3,9 +3,11 @@ Kernel configuration and initialization.
 '''
 
 import os
+import httpx
 from dotenv import load_dotenv
+from openai import AsyncAzureOpenAI
 
-from azure.identity import AzureCliCredential
+from azure.identity import AzureCliCredential, get_bearer_token_provider
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import (
     AzureChatCompletion,
@@ -13,7 +15,40 @@ from semantic_kernel.connectors.ai.open_ai import (
 )
 
 
-def create_kernel() -> Kernel:
+# Token scope for Azure OpenAI when authenticating with Azure CLI credential
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+
+def create_http_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    '''
+    Create a long-lived, connection-pooled HTTP client.
+    
+    Intended to be created once at startup and shared by every Azure OpenAI
+    service so requests reuse warm TLS connections instead of each service
+    keeping its own pool. HTTP/2 is enabled when the h2 package (the
+    httpx[http2] extra in requirements.txt) is installed.
+    
+    Args:
+        timeout: Default request timeout in seconds. The OpenAI client sets
+                its own per-request timeout, so this applies to other callers.
+    
+    Returns:
+        httpx.AsyncClient that the caller is responsible for closing
+    '''
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+def create_kernel(http_client: httpx.AsyncClient | None = None) -> Kernel:
     '''
     Create and configure a Semantic Kernel instance.
     
@@ -21,6 +56,10 @@ def create_kernel() -> Kernel:
     - Azure OpenAI chat completion service
     - Azure OpenAI text embedding service
     
+    Args:
+        http_client: Optional shared HTTP client. When provided, both services
+                    send their requests through it instead of creating their own.
+    
     Returns:
         Configured Kernel instance
     '''
@@ -44,12 +83,21 @@ def create_kernel() -> Kernel:
     # Configure authentication
     if api_key:
         # Use API key authentication
+        async_client = None
+        if http_client is not None:
+            async_client = AsyncAzureOpenAI(
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                api_version=api_version,
+                http_client=http_client,
+            )
         chat_service = AzureChatCompletion(
             service_id=chat_service_id,
             deployment_name=chat_deployment,
             endpoint=endpoint,
             api_key=api_key,
             api_version=api_version,
+            async_client=async_client,
         )
         embedding_service = AzureTextEmbedding(
             service_id=embedding_service_id,
@@ -57,16 +105,28 @@ def create_kernel() -> Kernel:
             endpoint=endpoint,
             api_key=api_key,
             api_version=api_version,
+            async_client=async_client,
         )
     else:
         # Use Azure CLI credential
         credential = AzureCliCredential()
+        async_client = None
+        if http_client is not None:
+            async_client = AsyncAzureOpenAI(
+                azure_endpoint=endpoint,
+                azure_ad_token_provider=get_bearer_token_provider(
+                    credential, COGNITIVE_SERVICES_SCOPE
+                ),
+                api_version=api_version,
+                http_client=http_client,
+            )
         chat_service = AzureChatCompletion(
             service_id=chat_service_id,
             deployment_name=chat_deployment,
             endpoint=endpoint,
             credential=credential,
             api_version=api_version,
+            async_client=async_client,
         )
         embedding_service = AzureTextEmbedding(
             service_id=embedding_service_id,
@@ -74,6 +134,7 @@ def create_kernel() -> Kernel:
             endpoint=endpoint,
             credential=credential,
             api_version=api_version,
+            async_client=async_client,
         )
     
     # Add services to kernel
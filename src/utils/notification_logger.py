@@ -4,7 +4,7 @@ Notification logger for tracking SRM update notifications.
 
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
@@ -50,7 +50,7 @@ class NotificationLogger:
             additional_info: Optional additional information to log
         """
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
             'srm_id': srm_id,
             'recipients': recipients,
             'fields_changed': fields_changed,
@@ -82,7 +82,7 @@ class NotificationLogger:
             sent_by: Optional name/email of person who requested the change
         """
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
             'srm_id': srm_id,
             'recipients': recipients,
             'fields_changed': fields_changed or [],
@@ -5,15 +5,41 @@ This module handles loading and registering prompt-based plugins from the filesy
 '''
 
 import os
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from semantic_kernel import Kernel
 from semantic_kernel.functions import KernelArguments
 from semantic_kernel.prompt_template import PromptTemplateConfig
 
 
+@lru_cache(maxsize=32)
+def _read_plugin_files(
+    config_path: str,
+    config_mtime_ns: int,
+    config_size: int,
+    prompt_path: str,
+    prompt_mtime_ns: int,
+    prompt_size: int,
+) -> tuple[dict, str]:
+    '''
+    Read and parse a plugin's config.json and skprompt.txt.
+    
+    The modification times and sizes are part of the cache key, so an edited
+    file is read again while unchanged files are only parsed once per process.
+    Callers must treat the returned config as read-only.
+    
+    Returns:
+        Tuple of (config data, prompt template)
+    '''
+    config_data = orjson.loads(Path(config_path).read_bytes())
+    prompt_template = Path(prompt_path).read_text(encoding='utf-8')
+    return config_data, prompt_template
+
+
 def load_prompt_plugin(
     kernel: Kernel,
     plugin_name: str,
@@ -43,13 +69,13 @@ def load_prompt_plugin(
     if not prompt_file.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
     
-    # Load config
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config_data = json.load(f)
-    
-    # Load prompt template
-    with open(prompt_file, 'r', encoding='utf-8') as f:
-        prompt_template = f.read()
+    # Load config and prompt template (reused while both files are unchanged)
+    config_stat = config_file.stat()
+    prompt_stat = prompt_file.stat()
+    config_data, prompt_template = _read_plugin_files(
+        str(config_file), config_stat.st_mtime_ns, config_stat.st_size,
+        str(prompt_file), prompt_stat.st_mtime_ns, prompt_stat.st_size,
+    )
     
     # Use function name or default to plugin name
     func_name = function_name or plugin_name
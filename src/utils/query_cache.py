@@ -0,0 +1,136 @@
+'''
+In-memory LRU cache of final answers for repeated SRM discovery queries.
+
+Only final answers are cached; rejections, clarifications and errors are
+always recomputed so multi-turn dialog is never short-circuited.
+'''
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+
+class CachedAnswer(NamedTuple):
+    '''
+    Final answer stored for a query, with what its run selected.
+
+    Kept alongside the answer text so a cache hit can be logged to
+    telemetry like the run that produced it.
+    '''
+    answer: str
+    selected_id: str | None
+    confidence: float
+
+
+def normalize_query(query: str) -> str:
+    '''
+    Normalize a query for cache lookup.
+
+    Args:
+        query: Raw user query
+
+    Returns:
+        Lowercased query with whitespace collapsed
+    '''
+    return " ".join(query.lower().split())
+
+
+class QueryCache:
+    '''
+    Least-recently-used cache with a per-entry time-to-live.
+
+    Entries are keyed by the normalized query. A maxsize of 0 disables
+    the cache. Queries matching the optional bypass pattern (e.g. ones
+    that mention volatile entities) are never cached.
+
+    Every clear() starts a new generation. A run that reads the generation
+    when it starts and passes it to put() cannot store an answer computed
+    before the cache was cleared.
+    '''
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0, bypass_pattern: str | None = None):
+        '''
+        Initialize the query cache.
+
+        Args:
+            maxsize: Maximum number of cached answers (0 disables caching)
+            ttl: Seconds an answer stays valid after it is stored
+            bypass_pattern: Optional case-insensitive regex; matching queries
+                           are not cached
+
+        Raises:
+            re.error: If bypass_pattern is not a valid regex
+        '''
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.bypass = re.compile(bypass_pattern, re.IGNORECASE) if bypass_pattern else None
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_cacheable(self, query: str) -> bool:
+        '''
+        Check whether answers for a query may be cached.
+
+        Args:
+            query: User query
+
+        Returns:
+            False if caching is disabled or the query matches the bypass pattern
+        '''
+        return self.maxsize > 0 and not (self.bypass and self.bypass.search(query))
+
+    def get(self, query: str) -> Optional[Any]:
+        '''
+        Return the cached answer for a query, if present and not expired.
+
+        Args:
+            query: User query (normalized internally)
+
+        Returns:
+            Cached answer or None
+        '''
+        if not self.is_cacheable(query):
+            return None
+
+        key = normalize_query(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, answer = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return answer
+
+    def put(self, query: str, answer: Any, generation: int | None = None) -> None:
+        '''
+        Store the final answer for a query, evicting the least recently used.
+
+        Args:
+            query: User query (normalized internally)
+            answer: Final answer to cache (the server stores CachedAnswer)
+            generation: Cache generation read when the answer's run started;
+                       the answer is dropped if the cache was cleared since
+        '''
+        if not self.is_cacheable(query):
+            return
+        if generation is not None and generation != self.generation:
+            return
+
+        key = normalize_query(query)
+        self._entries[key] = (time.monotonic() + self.ttl, answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        '''Drop all cached answers (e.g. after feedback changes the index).'''
+        self._entries.clear()
+        self.generation += 1
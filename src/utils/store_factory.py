@@ -25,6 +25,7 @@ def create_vector_store(
 
     Environment Variables:
         VECTOR_STORE_TYPE: Store type ("in_memory")
+        QUERY_EMBED_BATCH_SIZE: Max concurrent search queries per embedding request
 
     Returns:
         VectorStoreBase implementation instance
@@ -62,7 +63,10 @@ def create_vector_store(
         if not embedding_generator:
             raise ValueError("embedding_generator is required for in_memory store")
         print("[*] Using In-Memory vector store")
-        return InMemoryVectorStore(embedding_generator)
+        return InMemoryVectorStore(
+            embedding_generator,
+            query_batch_size=int(os.getenv('QUERY_EMBED_BATCH_SIZE', '16'))
+        )
     else:
         raise ValueError(
             f"Invalid vector store type: {store_type}. "
@@ -2,8 +2,11 @@
 Simple telemetry logging for process events.
 '''
 
+import asyncio
 import json
 import logging
+import threading
+from contextlib import suppress
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,30 +17,46 @@ class TelemetryLogger:
     Simple JSONL logger for telemetry events.
     
     Logs events to a JSONL file for easy analysis with grep/jq.
+
+    By default each event is appended as it is emitted. After start() is
+    called from a running event loop, events are buffered and written in
+    batches by a background task (every flush_interval seconds or once
+    batch_size events are pending), so emitting never blocks on file I/O.
     '''
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", flush_interval: float = 0.05, batch_size: int = 100):
         '''
         Initialize the telemetry logger.
         
         Args:
-            log_dir: Directory to store log files
+            log_dir: Directory to store log files (created on first write)
+            flush_interval: Seconds between batched writes once started
+            batch_size: Pending events that trigger an early batched write
         '''
         from src.utils.debug_config import is_debug
         
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Create log file with date
         date_str = datetime.now().strftime("%Y%m%d")
         self.log_file = self.log_dir / f"events_{date_str}.jsonl"
+
+        # Batched writes (enabled by start())
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: list[str] = []
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._flush_task: asyncio.Task | None = None
         
         # Set up Python logger
         self.logger = logging.getLogger("telemetry")
         self.logger.setLevel(logging.INFO)
         
-        # Console handler - only add if debug mode is enabled
-        if is_debug():
+        # Console handler - only add if debug mode is enabled (once, as every
+        # instance shares the "telemetry" logger)
+        if is_debug() and not self.logger.handlers:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -56,12 +75,79 @@ class TelemetryLogger:
             event['ts'] = datetime.now().isoformat()
         
         try:
-            # Write to JSONL file
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(event) + '\n')
+            line = json.dumps(event) + '\n'
         except Exception as e:
             # Never fail user request if logging fails
             self.logger.warning(f"Failed to write telemetry event: {e}")
+            return
+
+        if self._flush_task is None:
+            self._write_lines([line])
+            return
+
+        # May be called from worker threads, so guard the buffer and wake
+        # the flush task through the loop (on the first pending event, to
+        # start a batch window, and when the batch fills up)
+        with self._lock:
+            self._pending.append(line)
+            pending = len(self._pending)
+        if pending == 1 or pending >= self.batch_size:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def start(self) -> None:
+        '''
+        Switch to batched writes flushed by a task on the running event loop.
+        '''
+        if self._flush_task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._flush_task = self._loop.create_task(self._flush_loop())
+
+    async def aclose(self) -> None:
+        '''
+        Stop the background flush task and write any pending events.
+        '''
+        task = self._flush_task
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            self._flush_task = None
+        self.flush()
+
+    def flush(self) -> None:
+        '''
+        Write all pending events to the log file.
+        '''
+        with self._lock:
+            lines, self._pending = self._pending, []
+        if lines:
+            self._write_lines(lines)
+
+    def _write_lines(self, lines: list[str]) -> None:
+        '''Append serialized events to the JSONL file.'''
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+        except Exception as e:
+            # Never fail user request if logging fails
+            self.logger.warning(f"Failed to write telemetry events: {e}")
+
+    async def _flush_loop(self) -> None:
+        '''
+        Write pending events flush_interval after the first one arrives, or
+        as soon as a batch fills up. Sleeps while nothing is pending.
+        '''
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if len(self._pending) < self.batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+                self._wake.clear()
+            await asyncio.to_thread(self.flush)
     
     def log_router_classified(
         self, 
@@ -102,15 +188,17 @@ class TelemetryLogger:
         session_id: str, 
         selected_id: str | None, 
         confidence: float,
-        alternatives_count: int = 0
+        alternatives_count: int = 0,
+        cache_hit: bool = False
     ) -> None:
-        '''Log when an answer is published to the user.'''
+        '''Log when an answer is published to the user (cache_hit: served from a cache).'''
         self.emit({
             'event_type': 'answer_published',
             'session_id': session_id,
             'selected_id': selected_id,
             'confidence': confidence,
             'alts_count': alternatives_count,
+            'cache_hit': cache_hit,
         })
     
     def log_error(
@@ -229,3 +317,15 @@ class TelemetryLogger:
             'user_id': user_id,
         })
 
+
+
+class NullTelemetryLogger(TelemetryLogger):
+    '''
+    Telemetry logger that discards every event.
+
+    For synthetic runs, such as precomputing answers to common queries,
+    that must not show up in analytics as user queries. Creates no files.
+    '''
+
+    def emit(self, event: dict[str, Any]) -> None:
+        '''Discard the event.'''
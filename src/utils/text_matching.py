@@ -1,6 +1,7 @@
 '''Fuzzy text matching utilities for hybrid search.'''
 
 from difflib import SequenceMatcher
+from functools import lru_cache
 import re
 from typing import TYPE_CHECKING
 
@@ -8,6 +9,34 @@ if TYPE_CHECKING:
     from src.models.srm_record import SRMRecord
 
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Exact ratio per (query token, field token) pair, shared across queries.
+# Field tokens come from a stable catalog and query vocabulary repeats, so
+# most pairs recur; the cache is cleared whenever it reaches its size limit.
+_PAIR_RATIO_CACHE_SIZE = 65536
+_pair_ratios: dict[tuple[str, str], float] = {}
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> tuple[str, ...]:
+    '''
+    Tokenize text, memoized.
+
+    Record fields are the same strings on every search, so after the first
+    query their tokens come straight from the cache. Returns a tuple so
+    cached results cannot be mutated by callers.
+
+    Args:
+        text: Input text to tokenize
+
+    Returns:
+        Tuple of lowercase tokens with punctuation removed
+    '''
+    # Remove punctuation and split on whitespace
+    return tuple(_PUNCTUATION_RE.sub(' ', text).lower().split())
+
+
 def extract_tokens(text: str) -> list[str]:
     '''
     Extract lowercase tokens from text.
@@ -18,10 +47,7 @@ def extract_tokens(text: str) -> list[str]:
     Returns:
         List of lowercase tokens with punctuation removed
     '''
-    # Remove punctuation and split on whitespace
-    cleaned = re.sub(r'[^\w\s]', ' ', text)
-    tokens = cleaned.lower().split()
-    return tokens
+    return list(_tokenize(text))
 
 
 def fuzzy_match_score(query: str, target: str) -> float:
@@ -66,6 +92,31 @@ def search_record_fields(
     Returns:
         Maximum weighted fuzzy match score across all fields
     '''
+    return score_records(query, [record], field_weights)[0]
+
+
+def score_records(
+    query: str,
+    records: list['SRMRecord'],
+    field_weights: dict[str, float] | None = None
+) -> list[float]:
+    '''
+    Score many records against one query in a single pass.
+
+    Query preparation (tokens, lowercasing, the matcher) is done once for
+    the whole batch. Token pairs repeat across records (shared words like
+    "database" or "request"), so each pair's quick_ratio bound is computed
+    at most once per batch, and its exact ratio at most once until the
+    shared pair cache is cleared.
+
+    Args:
+        query: Query string
+        records: SRMRecords to score
+        field_weights: Optional field weights (default: name=1.0, category=0.7, use_case=1.0)
+
+    Returns:
+        One score per record, in input order (see search_record_fields)
+    '''
     if field_weights is None:
         field_weights = {
             'name': 1.0,
@@ -74,30 +125,99 @@ def search_record_fields(
         }
 
     # Extract tokens from query
-    query_tokens = extract_tokens(query)
+    query_tokens = _tokenize(query)
+    query_lower = query.lower()
+    matcher = SequenceMatcher(None)
+
+    # Exact ratios come from the shared cache; quick_ratio bounds are only
+    # reused within this batch
+    pair_ratio = _pair_ratios
+    pair_bound: dict[tuple[str, str], float] = {}
 
-    max_score = 0.0
+    scores = []
+    for record in records:
+        max_score = 0.0
 
-    # Check each weighted field
-    for field_name, weight in field_weights.items():
-        if not hasattr(record, field_name):
-            continue
+        # Check each weighted field
+        for field_name, weight in field_weights.items():
+            if not hasattr(record, field_name):
+                continue
 
-        field_value = getattr(record, field_name)
-        if not field_value:
-            continue
+            field_value = getattr(record, field_name)
+            if not field_value:
+                continue
 
-        # Get best fuzzy match for any query token against this field
-        field_tokens = extract_tokens(field_value)
+            # Get best fuzzy match for any query token against this field
+            field_tokens = _tokenize(field_value)
 
-        # Try matching full query against full field
-        full_match_score = fuzzy_match_score(query, field_value) * weight
-        max_score = max(max_score, full_match_score)
+            # Try matching full query against full field
+            matcher.set_seqs(query_lower, field_value.lower())
+            max_score = _raise_max_score(matcher, weight, max_score)
 
-        # Try matching individual query tokens against field tokens
-        for q_token in query_tokens:
+            # Try matching individual query tokens against field tokens,
+            # skipping pairs whose upper bound cannot raise max_score
+            # (the same pruning as _raise_max_score, with cached results)
             for f_token in field_tokens:
-                token_score = fuzzy_match_score(q_token, f_token) * weight
-                max_score = max(max_score, token_score)
+                for q_token in query_tokens:
+                    pair = (q_token, f_token)
+                    ratio = pair_ratio.get(pair)
+                    if ratio is None:
+                        bound = pair_bound.get(pair)
+                        if bound is None:
+                            _set_pair(matcher, q_token, f_token)
+                            # Length-only bound; cheap enough not to cache
+                            if matcher.real_quick_ratio() * weight <= max_score:
+                                continue
+                            bound = pair_bound[pair] = matcher.quick_ratio()
+                        if bound * weight <= max_score:
+                            continue
+                        _set_pair(matcher, q_token, f_token)
+                        ratio = matcher.ratio()
+                        if len(pair_ratio) >= _PAIR_RATIO_CACHE_SIZE:
+                            pair_ratio.clear()
+                        pair_ratio[pair] = ratio
+                    max_score = max(max_score, ratio * weight)
+
+        scores.append(max_score)
+
+    return scores
+
+
+def _set_pair(matcher: SequenceMatcher, q_token: str, f_token: str) -> None:
+    '''
+    Point the matcher at a token pair, keeping its cached analysis of
+    f_token when it is already the second sequence.
 
-    return max_score
+    Args:
+        matcher: Shared SequenceMatcher
+        q_token: Query token (first sequence)
+        f_token: Field token (second sequence)
+    '''
+    if matcher.b != f_token:
+        matcher.set_seq2(f_token)
+    if matcher.a != q_token:
+        matcher.set_seq1(q_token)
+
+
+def _raise_max_score(matcher: SequenceMatcher, weight: float, max_score: float) -> float:
+    '''
+    Return the larger of max_score and the matcher's weighted ratio.
+
+    ratio() <= quick_ratio() <= real_quick_ratio(), and the bounds are much
+    cheaper (sequence lengths, then a character count overlap). Pairs whose
+    bound cannot beat max_score skip the full ratio(), which leaves the
+    result unchanged.
+
+    Args:
+        matcher: SequenceMatcher with both sequences set
+        weight: Field weight applied to the ratio
+        max_score: Best weighted score so far
+
+    Returns:
+        Updated best weighted score
+    '''
+    if matcher.real_quick_ratio() * weight <= max_score:
+        return max_score
+    if matcher.quick_ratio() * weight <= max_score:
+        return max_score
+    return max(max_score, matcher.ratio() * weight)
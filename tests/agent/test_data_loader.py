@@ -0,0 +1,282 @@
+"""
+SRM Data Loader Tests
+
+Purpose: Test loading the SRM catalog and embedding records for indexing.
+
+Type: Unit
+Test Count: 11
+
+Key Test Areas:
+1. Batched, concurrent embedding generation with retry
+2. Indexing with and without an embedding generator
+3. Reuse of cached embeddings
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.data.data_loader import SRMDataLoader
+from src.models.srm_record import SRMRecord
+from src.utils.embedding_cache import EmbeddingCache
+
+
+def _make_records(count: int) -> list[SRMRecord]:
+    """Create simple SRM records whose embedding field still holds text."""
+    return [
+        SRMRecord(
+            id=f"SRM-{i:03d}",
+            name=f"Service {i}",
+            category="Services",
+            owning_team="Team",
+            use_case="x" * i,
+            text=f"Service {i}",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def mock_embedding_generator():
+    """Embedding generator returning one vector per input text."""
+    generator = MagicMock()
+    generator.ai_model_id = "text-embedding-test"
+    generator.generate_embeddings = AsyncMock(
+        side_effect=lambda texts: [[float(len(text))] * 4 for text in texts]
+    )
+    return generator
+
+
+@pytest.fixture
+def catalog_csv(tmp_path):
+    """Write a small SRM catalog in srm_index.csv format."""
+    csv_path = tmp_path / "srm_index.csv"
+    csv_path.write_text(
+        "SRM_ID,Name,Description,URL_Link,Team,TechnologiesTeamWorksWith,Type\n"
+        "SRM-001,Backup,Restore data,http://x,Storage Team,Veeam,Services\n"
+        "SRM-002,VM Build,Provision a VM,http://y,Cloud Team,VMware,Services\n",
+        encoding="utf-8",
+    )
+    return csv_path
+
+
+class TestEmbedRecords:
+    """Tests for batched embedding generation."""
+
+    @pytest.mark.asyncio
+    async def test_embeds_records_in_batches(self, mock_embedding_generator):
+        """Records are embedded embed_batch_size texts per request."""
+        loader = SRMDataLoader(
+            MagicMock(),
+            embedding_generator=mock_embedding_generator,
+            embed_batch_size=4,
+        )
+        records = _make_records(10)
+        texts = {record.id: record.embedding for record in records}
+
+        await loader.embed_records(records)
+
+        batch_sizes = [
+            len(call.args[0])
+            for call in mock_embedding_generator.generate_embeddings.call_args_list
+        ]
+        assert batch_sizes == [4, 4, 2]
+        for record in records:
+            assert record.embedding == [float(len(texts[record.id]))] * 4
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_batch(self, mock_embedding_generator, monkeypatch):
+        """A failing batch is retried without failing the whole load."""
+        monkeypatch.setattr("src.data.data_loader.asyncio.sleep", AsyncMock())
+        embed = mock_embedding_generator.generate_embeddings.side_effect
+        mock_embedding_generator.generate_embeddings.side_effect = [
+            Exception("429 Too Many Requests"),
+            embed(["a", "bb"]),
+        ]
+        loader = SRMDataLoader(MagicMock(), embedding_generator=mock_embedding_generator)
+        records = _make_records(2)
+
+        await loader.embed_records(records)
+
+        assert mock_embedding_generator.generate_embeddings.await_count == 2
+        assert all(isinstance(record.embedding, list) for record in records)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_texts(self, mock_embedding_generator, monkeypatch):
+        """A batch that keeps failing is embedded one text per request."""
+        monkeypatch.setattr("src.data.data_loader.asyncio.sleep", AsyncMock())
+        embed = mock_embedding_generator.generate_embeddings.side_effect
+
+        def reject_batches(texts):
+            if len(texts) > 1:
+                raise Exception("400 Bad Request")
+            return embed(texts)
+
+        mock_embedding_generator.generate_embeddings.side_effect = reject_batches
+        loader = SRMDataLoader(MagicMock(), embedding_generator=mock_embedding_generator)
+
+        embeddings = await loader.embed_texts(["a", "bbb", "cc"])
+
+        assert embeddings == [[1.0] * 4, [3.0] * 4, [2.0] * 4]
+
+    @pytest.mark.asyncio
+    async def test_single_text_fallback_runs_concurrently(self, mock_embedding_generator, monkeypatch):
+        """The single-text requests of a failed batch run at the same time."""
+        monkeypatch.setattr("src.data.data_loader.asyncio.sleep", AsyncMock())
+        active = 0
+        max_active = 0
+
+        async def reject_batches(texts):
+            nonlocal active, max_active
+            if len(texts) > 1:
+                raise Exception("400 Bad Request")
+            active += 1
+            max_active = max(max_active, active)
+            # Yield to the other requests (asyncio.sleep is patched out)
+            yielded = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(yielded.set_result, None)
+            await yielded
+            active -= 1
+            return [[float(len(texts[0]))] * 4]
+
+        mock_embedding_generator.generate_embeddings.side_effect = reject_batches
+        loader = SRMDataLoader(MagicMock(), embedding_generator=mock_embedding_generator)
+
+        embeddings = await loader.embed_texts(["a", "bbb", "cc"])
+
+        assert embeddings == [[1.0] * 4, [3.0] * 4, [2.0] * 4]
+        assert max_active > 1
+
+    @pytest.mark.asyncio
+    async def test_text_failing_alone_gets_none(self, mock_embedding_generator, monkeypatch):
+        """A text that fails even on its own does not fail the other texts."""
+        monkeypatch.setattr("src.data.data_loader.asyncio.sleep", AsyncMock())
+        embed = mock_embedding_generator.generate_embeddings.side_effect
+
+        def reject_bad_text(texts):
+            if "bad" in texts:
+                raise Exception("400 Bad Request")
+            return embed(texts)
+
+        mock_embedding_generator.generate_embeddings.side_effect = reject_bad_text
+        loader = SRMDataLoader(MagicMock(), embedding_generator=mock_embedding_generator)
+
+        embeddings = await loader.embed_texts(["a", "bad", "cc"])
+
+        assert embeddings == [[1.0] * 4, None, [2.0] * 4]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self, mock_embedding_generator):
+        """Identical texts share one embedding request slot."""
+        loader = SRMDataLoader(MagicMock(), embedding_generator=mock_embedding_generator)
+
+        embeddings = await loader.embed_texts(["aa", "b", "aa", "b", "aa"])
+
+        sent = [text for call in mock_embedding_generator.generate_embeddings.call_args_list
+                for text in call.args[0]]
+        assert sorted(sent) == ["aa", "b"]
+        assert embeddings == [[2.0] * 4, [1.0] * 4, [2.0] * 4, [1.0] * 4, [2.0] * 4]
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_requests(self):
+        """No more than embed_concurrency requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def generate_embeddings(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [[0.0] for _ in texts]
+
+        generator = MagicMock()
+        generator.generate_embeddings = generate_embeddings
+        loader = SRMDataLoader(
+            MagicMock(),
+            embedding_generator=generator,
+            embed_batch_size=1,
+            embed_concurrency=2,
+        )
+
+        await loader.embed_records(_make_records(6))
+
+        assert peak == 2
+
+    def test_rejects_non_positive_batch_size(self):
+        """A batch size below 1 is rejected."""
+        with pytest.raises(ValueError):
+            SRMDataLoader(MagicMock(), embed_batch_size=0)
+
+
+class TestLoadAndIndex:
+    """Tests for loading and indexing the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_pre_embedded_records(self, mock_embedding_generator, catalog_csv):
+        """Records reach the store with embeddings already generated."""
+        vector_store = MagicMock()
+        vector_store.ensure_collection_exists = AsyncMock()
+        vector_store.upsert = AsyncMock()
+        loader = SRMDataLoader(vector_store, embedding_generator=mock_embedding_generator)
+
+        count = await loader.load_and_index(catalog_csv)
+
+        assert count == 2
+        mock_embedding_generator.generate_embeddings.assert_awaited_once()
+        upserted = vector_store.upsert.call_args.args[0]
+        assert [record.id for record in upserted] == ["SRM-001", "SRM-002"]
+        assert all(isinstance(record.embedding, list) for record in upserted)
+
+    @pytest.mark.asyncio
+    async def test_reuses_cached_embeddings(self, mock_embedding_generator, catalog_csv, tmp_path):
+        """A second load with the same cache does not call the embedding service."""
+        vector_store = MagicMock()
+        vector_store.ensure_collection_exists = AsyncMock()
+        vector_store.upsert = AsyncMock()
+        cache = EmbeddingCache(tmp_path / "cache")
+
+        for _ in range(2):
+            loader = SRMDataLoader(
+                vector_store,
+                embedding_generator=mock_embedding_generator,
+                embedding_cache=cache,
+            )
+            await loader.load_and_index(catalog_csv)
+
+        mock_embedding_generator.generate_embeddings.assert_awaited_once()
+        upserted = vector_store.upsert.call_args.args[0]
+        assert all(isinstance(record.embedding, list) for record in upserted)
+
+
+    @pytest.mark.asyncio
+    async def test_skips_records_that_cannot_be_embedded(
+        self, mock_embedding_generator, catalog_csv, monkeypatch, tmp_path
+    ):
+        """A record whose text keeps failing is left out; the rest are indexed."""
+        monkeypatch.setattr("src.data.data_loader.asyncio.sleep", AsyncMock())
+        embed = mock_embedding_generator.generate_embeddings.side_effect
+
+        def reject_backup(texts):
+            if any(text.startswith("Backup") for text in texts):
+                raise Exception("400 Bad Request")
+            return embed(texts)
+
+        mock_embedding_generator.generate_embeddings.side_effect = reject_backup
+        vector_store = MagicMock()
+        vector_store.ensure_collection_exists = AsyncMock()
+        vector_store.upsert = AsyncMock()
+        loader = SRMDataLoader(
+            vector_store,
+            embedding_generator=mock_embedding_generator,
+            embedding_cache=EmbeddingCache(tmp_path / "cache"),
+        )
+
+        count = await loader.load_and_index(catalog_csv)
+
+        assert count == 1
+        upserted = vector_store.upsert.call_args.args[0]
+        assert [record.id for record in upserted] == ["SRM-002"]
+        assert isinstance(upserted[0].embedding, list)
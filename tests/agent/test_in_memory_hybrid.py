@@ -116,3 +116,20 @@ async def test_hybrid_search_no_matches(populated_store):
     # May return low-scoring results or empty
     # Key test: doesn't crash
     assert isinstance(results, list)
+
+
+@pytest.mark.asyncio
+async def test_ensure_collection_exists_is_idempotent(mock_embedding_generator):
+    '''Repeated ensure calls keep the existing collection and its records.'''
+    store = InMemoryVectorStore(mock_embedding_generator)
+    await store.ensure_collection_exists()
+    await store.upsert([
+        SRMRecord(id="1", name="VM Provisioning", category="Provisioning",
+                  owning_team="Cloud Team", use_case="Provision a VM", text="VM Provisioning")
+    ])
+    collection = store.collection
+
+    await store.ensure_collection_exists()
+
+    assert store.collection is collection
+    assert await store.get_by_id("1") is not None
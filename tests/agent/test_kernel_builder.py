@@ -4,7 +4,7 @@ Kernel Builder Tests
 Purpose: Test Semantic Kernel initialization and configuration.
 
 Type: Unit
-Test Count: 4
+Test Count: 5
 
 Key Test Areas:
 - Kernel creation with API key
@@ -17,10 +17,11 @@ Dependencies:
 - Environment variable mocking
 """
 
+import asyncio
 import pytest
 import os
 from unittest.mock import patch, Mock, MagicMock
-from src.utils.kernel_builder import create_kernel
+from src.utils.kernel_builder import create_kernel, create_http_client
 
 
 class TestCreateKernel:
@@ -169,6 +170,37 @@ class TestCreateKernel:
         embedding_kwargs = mock_embedding.call_args[1]
         assert embedding_kwargs['deployment_name'] == 'text-embedding-3-small'  # Default
 
+    @patch.dict(os.environ, {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com',
+        'AZURE_OPENAI_API_KEY': 'test-api-key'
+    })
+    @patch('src.utils.kernel_builder.AzureChatCompletion')
+    @patch('src.utils.kernel_builder.AzureTextEmbedding')
+    @patch('src.utils.plugin_loader.load_all_plugins')
+    def test_shares_http_client_between_services(
+        self, mock_load_plugins, mock_embedding, mock_chat
+    ):
+        """
+        Test that a provided HTTP client is shared by chat and embedding services.
+        """
+        # Arrange
+        mock_chat.return_value = Mock()
+        mock_embedding.return_value = Mock()
+        http_client = create_http_client()
+
+        try:
+            # Act
+            create_kernel(http_client=http_client)
+
+            # Assert - both services get the same OpenAI client built on http_client
+            chat_client = mock_chat.call_args[1]['async_client']
+            embedding_client = mock_embedding.call_args[1]['async_client']
+            assert chat_client is not None
+            assert chat_client is embedding_client
+            assert chat_client._client is http_client
+        finally:
+            asyncio.run(http_client.aclose())
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -174,3 +174,19 @@ async def test_delete_temp_srm_calls_api():
 
     data = json.loads(result)
     assert data["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_uses_shared_http_client():
+    """Calls go through the shared client when one is provided."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"total_srms": 3, "temp_srms": 0}
+    shared_client = MagicMock()
+    shared_client.get = AsyncMock(return_value=mock_response)
+
+    plugin = ConciergeAPIClientPlugin(http_client=shared_client)
+    result = await plugin.get_stats()
+
+    shared_client.get.assert_awaited_once()
+    assert json.loads(result)["total_srms"] == 3
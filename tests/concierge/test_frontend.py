@@ -0,0 +1,46 @@
+"""Tests for serving the frontend page."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from run_chatbot import app
+
+
+ETAG = '"abc123"'
+
+
+@pytest.fixture
+def test_client():
+    """Create test client serving a fixed page."""
+    app.state.index_html = b"<html></html>"
+    app.state.index_etag = ETAG
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("if_none_match", [
+    ETAG,
+    f"W/{ETAG}",
+    f'"other", {ETAG}',
+    '"other",W/"abc123"',
+    "*",
+])
+def test_current_copy_gets_not_modified(test_client, if_none_match):
+    """Test any matching entity tag in If-None-Match returns 304."""
+    # Act
+    response = test_client.get("/", headers={"If-None-Match": if_none_match})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.headers["ETag"] == ETAG
+
+
+@pytest.mark.parametrize("if_none_match", [None, '"other"', '"other", W/"abc"'])
+def test_stale_copy_gets_page(test_client, if_none_match):
+    """Test a missing or non-matching If-None-Match returns the page."""
+    # Act
+    headers = {"If-None-Match": if_none_match} if if_none_match else {}
+    response = test_client.get("/", headers=headers)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.content == b"<html></html>"
@@ -0,0 +1,47 @@
+"""Tests for the query endpoint's cached answers."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from run_chatbot import app
+from src.utils.query_cache import CachedAnswer, QueryCache
+from src.utils.telemetry import TelemetryLogger
+
+
+@pytest.fixture
+def test_client():
+    """Create test client."""
+    return TestClient(app)
+
+
+def test_cache_hit_logs_answer_for_returned_session(test_client, tmp_path):
+    """Test a cache hit still logs an answer event under the returned session_id."""
+    # Arrange
+    query_cache = QueryCache()
+    query_cache.put("reset my password", CachedAnswer("Use SRM-001", "SRM-001", 0.9))
+    app.state.canned_answers = QueryCache(maxsize=0)
+    app.state.query_cache = query_cache
+    app.state.inflight = {}
+    app.state.telemetry = TelemetryLogger(log_dir=str(tmp_path))
+
+    # Act
+    response = test_client.post("/api/query", json={"query": "reset my password"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "HIT"
+    data = response.json()
+    assert data["response"] == "Use SRM-001"
+
+    events = [
+        json.loads(line)
+        for log_file in tmp_path.glob("*.jsonl")
+        for line in log_file.read_text().splitlines()
+    ]
+    published = [e for e in events if e["event_type"] == "answer_published"]
+    assert len(published) == 1
+    assert published[0]["session_id"] == data["session_id"]
+    assert published[0]["selected_id"] == "SRM-001"
+    assert published[0]["cache_hit"] is True
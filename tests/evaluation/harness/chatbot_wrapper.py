@@ -17,6 +17,7 @@ from src.utils.telemetry import TelemetryLogger
 from src.utils.store_factory import create_vector_store
 from src.data.data_loader import SRMDataLoader
 from src.processes.discovery.srm_discovery_process import SRMDiscoveryProcess
+from src.models.process_state import ResultContainer
 
 
 class ChatbotWrapper:
@@ -56,7 +57,7 @@ class ChatbotWrapper:
         store_type = os.getenv('VECTOR_STORE_TYPE', 'azure_search').lower()
 
         if store_type == 'in_memory':
-            data_loader = SRMDataLoader(self.vector_store)
+            data_loader = SRMDataLoader(self.vector_store, embedding_generator=embedding_service)
             await data_loader.load_and_index("data/srm_index.csv")
         else:
             # Azure AI Search - ensure collection exists
@@ -95,7 +96,7 @@ class ChatbotWrapper:
         session_id = str(uuid.uuid4())[:8]
 
         # Create result container
-        result_container = {}
+        result_container = ResultContainer()
         initial_data = {
             "user_query": user_query,
             "vector_store": self.vector_store,
@@ -119,12 +120,10 @@ class ChatbotWrapper:
                 # Get final state
                 await process_context.get_state()
 
-                # Extract result
-                result_data = result_container
                 processing_time_ms = int((time.time() - start_time) * 1000)
 
                 # Extract context (retrieved SRMs)
-                retrieved_context = result_data.get('retrieved_context', [])
+                retrieved_context = result_container.retrieved_context
 
                 # Format context as strings for evaluation
                 context_strings = []
@@ -134,12 +133,12 @@ class ChatbotWrapper:
 
                 # Build response
                 response = ""
-                if 'rejection_message' in result_data:
-                    response = f"[!] {result_data['rejection_message']}"
-                elif 'clarification' in result_data:
-                    response = f"[?] {result_data['clarification']}"
-                elif 'final_answer' in result_data:
-                    response = result_data['final_answer']
+                if result_container.rejection_message is not None:
+                    response = f"[!] {result_container.rejection_message}"
+                elif result_container.clarification is not None:
+                    response = f"[?] {result_container.clarification}"
+                elif result_container.final_answer is not None:
+                    response = result_container.final_answer
                 else:
                     response = "Process completed but no result was generated."
 
@@ -151,8 +150,8 @@ class ChatbotWrapper:
                         "session_id": session_id,
                         "processing_time_ms": processing_time_ms,
                         "num_retrieved": len(retrieved_context),
-                        "selected_srm_id": result_data.get('selected_id'),
-                        "confidence": result_data.get('confidence', 0.0),
+                        "selected_srm_id": result_container.selected_id,
+                        "confidence": result_container.confidence,
                     }
                 }
 
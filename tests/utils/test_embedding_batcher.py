@@ -0,0 +1,66 @@
+'''Tests for batching concurrent query embeddings.'''
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.utils.embedding_batcher import QueryEmbeddingBatcher
+
+
+def make_generator(delay: float = 0.0) -> MagicMock:
+    '''Embedding generator returning [len(text)] per text after an optional delay.'''
+    async def generate_embeddings(texts):
+        await asyncio.sleep(delay)
+        return [[float(len(text))] for text in texts]
+
+    generator = MagicMock()
+    generator.generate_embeddings = AsyncMock(side_effect=generate_embeddings)
+    return generator
+
+
+@pytest.mark.asyncio
+async def test_single_query_is_embedded():
+    '''A lone query is embedded in its own request.'''
+    generator = make_generator()
+    batcher = QueryEmbeddingBatcher(generator)
+
+    assert await batcher.embed("abc") == [3.0]
+    generator.generate_embeddings.assert_awaited_once_with(["abc"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_requests():
+    '''Queries arriving while requests are in flight are sent together.'''
+    generator = make_generator(delay=0.01)
+    batcher = QueryEmbeddingBatcher(generator, max_batch=16, max_in_flight=1)
+
+    results = await asyncio.gather(*(batcher.embed("x" * i) for i in range(1, 11)))
+
+    assert results == [[float(i)] for i in range(1, 11)]
+    assert generator.generate_embeddings.await_count < 10
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_max_batch():
+    '''No request carries more than max_batch texts.'''
+    generator = make_generator(delay=0.01)
+    batcher = QueryEmbeddingBatcher(generator, max_batch=3, max_in_flight=1)
+
+    await asyncio.gather(*(batcher.embed(str(i)) for i in range(10)))
+
+    sizes = [len(call.args[0]) for call in generator.generate_embeddings.call_args_list]
+    assert max(sizes) <= 3
+    assert sum(sizes) == 10
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_to_each_caller():
+    '''A failed request fails every query in its batch.'''
+    generator = MagicMock()
+    generator.generate_embeddings = AsyncMock(side_effect=Exception("429 Too Many Requests"))
+    batcher = QueryEmbeddingBatcher(generator)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(result, Exception) for result in results)
@@ -0,0 +1,186 @@
+'''Tests for the on-disk embedding cache.'''
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.utils.embedding_cache import EmbeddingCache
+
+
+def make_embed_fn(dimensions: int = 3) -> AsyncMock:
+    '''Embedding function returning a vector derived from each text's length.'''
+    return AsyncMock(side_effect=lambda texts: [[float(len(text))] * dimensions for text in texts])
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_computes_and_persists(tmp_path):
+    '''First call embeds every text and writes them to disk.'''
+    cache = EmbeddingCache(tmp_path)
+    embed_fn = make_embed_fn()
+
+    result = await cache.get_or_compute(["a", "bb"], "model-1", embed_fn)
+
+    assert result == [[1.0] * 3, [2.0] * 3]
+    embed_fn.assert_awaited_once_with(["a", "bb"])
+    assert (tmp_path / EmbeddingCache.VECTORS_FILE).exists()
+    assert (tmp_path / EmbeddingCache.INDEX_FILE).exists()
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_embedding(tmp_path):
+    '''A new cache instance reuses vectors written by a previous run.'''
+    await EmbeddingCache(tmp_path).get_or_compute(["a", "bb"], "model-1", make_embed_fn())
+    embed_fn = make_embed_fn()
+
+    result = await EmbeddingCache(tmp_path).get_or_compute(["bb", "a"], "model-1", embed_fn)
+
+    assert result == [[2.0] * 3, [1.0] * 3]
+    embed_fn.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_only_missing_texts_are_embedded(tmp_path):
+    '''Texts already cached are not sent again; duplicates are embedded once.'''
+    cache = EmbeddingCache(tmp_path)
+    await cache.get_or_compute(["a"], "model-1", make_embed_fn())
+    embed_fn = make_embed_fn()
+
+    result = await cache.get_or_compute(["a", "ccc", "ccc"], "model-1", embed_fn)
+
+    assert result == [[1.0] * 3, [3.0] * 3, [3.0] * 3]
+    embed_fn.assert_awaited_once_with(["ccc"])
+
+
+@pytest.mark.asyncio
+async def test_model_change_invalidates_cache(tmp_path):
+    '''Vectors cached for another model are not reused.'''
+    await EmbeddingCache(tmp_path).get_or_compute(["a"], "model-1", make_embed_fn())
+    embed_fn = make_embed_fn()
+
+    await EmbeddingCache(tmp_path).get_or_compute(["a"], "model-2", embed_fn)
+
+    embed_fn.assert_awaited_once_with(["a"])
+
+
+@pytest.mark.asyncio
+async def test_dimension_change_invalidates_cache(tmp_path):
+    '''A change in embedding size discards the existing cache.'''
+    cache = EmbeddingCache(tmp_path)
+    await cache.get_or_compute(["a"], "model-1", make_embed_fn(dimensions=3))
+
+    resized_fn = make_embed_fn(dimensions=5)
+    result = await cache.get_or_compute(["a", "bb"], "model-1", resized_fn)
+
+    assert result == [[1.0] * 5, [2.0] * 5]
+    # The missing text is embedded once; only the stale cached text is redone
+    assert [call.args[0] for call in resized_fn.await_args_list] == [["bb"], ["a"]]
+    embed_fn = make_embed_fn(dimensions=5)
+    assert await cache.get_or_compute(["a", "bb"], "model-1", embed_fn) == result
+    embed_fn.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_vectors_stored_as_float16_by_default(tmp_path):
+    '''Vectors are written at half precision and returned as floats.'''
+    cache = EmbeddingCache(tmp_path)
+
+    result = await cache.get_or_compute(["a", "bb"], "model-1", make_embed_fn(dimensions=4))
+
+    assert (tmp_path / EmbeddingCache.VECTORS_FILE).stat().st_size == 2 * 4 * 2
+    assert all(isinstance(value, float) for value in result[0])
+
+
+@pytest.mark.asyncio
+async def test_dtype_change_invalidates_cache(tmp_path):
+    '''Vectors cached at another precision are not reused.'''
+    await EmbeddingCache(tmp_path, dtype="float16").get_or_compute(["a"], "model-1", make_embed_fn())
+    embed_fn = make_embed_fn()
+
+    await EmbeddingCache(tmp_path, dtype="float32").get_or_compute(["a"], "model-1", embed_fn)
+
+    embed_fn.assert_awaited_once_with(["a"])
+
+
+@pytest.mark.asyncio
+async def test_key_format_change_invalidates_cache(tmp_path):
+    '''An index written with another key format is not reused.'''
+    await EmbeddingCache(tmp_path).get_or_compute(["a"], "model-1", make_embed_fn())
+    index_file = tmp_path / EmbeddingCache.INDEX_FILE
+    index = json.loads(index_file.read_text())
+    index["key_format"] = "sha256"
+    index_file.write_text(json.dumps(index))
+    embed_fn = make_embed_fn()
+
+    await EmbeddingCache(tmp_path).get_or_compute(["a"], "model-1", embed_fn)
+
+    embed_fn.assert_awaited_once_with(["a"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data[:-2],
+    lambda data: bytes(reversed(data)),
+])
+async def test_mismatched_vectors_are_a_cache_miss(tmp_path, corrupt):
+    '''A truncated or replaced vectors file is re-embedded, not read or raised.'''
+    await EmbeddingCache(tmp_path).get_or_compute(["a", "bb"], "model-1", make_embed_fn())
+    vectors_file = tmp_path / EmbeddingCache.VECTORS_FILE
+    vectors_file.write_bytes(corrupt(vectors_file.read_bytes()))
+    embed_fn = make_embed_fn()
+
+    result = await EmbeddingCache(tmp_path).get_or_compute(["a", "bb"], "model-1", embed_fn)
+
+    assert result == [[1.0] * 3, [2.0] * 3]
+    embed_fn.assert_awaited_once_with(["a", "bb"])
+
+
+@pytest.mark.asyncio
+async def test_writes_leave_no_temporary_files(tmp_path):
+    '''Both files are moved into place; only the cache files remain.'''
+    cache = EmbeddingCache(tmp_path)
+    await cache.get_or_compute(["a"], "model-1", make_embed_fn())
+    await cache.get_or_compute(["a", "bb"], "model-1", make_embed_fn())
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        EmbeddingCache.INDEX_FILE, EmbeddingCache.VECTORS_FILE
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_texts_are_not_cached(tmp_path):
+    '''Texts embed_fn returns None for come back as None and are retried next time.'''
+    cache = EmbeddingCache(tmp_path)
+    embed_fn = AsyncMock(side_effect=lambda texts: [None if text == "bad" else [1.0] * 3 for text in texts])
+
+    result = await cache.get_or_compute(["a", "bad"], "model-1", embed_fn)
+
+    assert result == [[1.0] * 3, None]
+    embed_fn = make_embed_fn()
+    assert await cache.get_or_compute(["a", "bad"], "model-1", embed_fn) == [[1.0] * 3, [3.0] * 3]
+    embed_fn.assert_awaited_once_with(["bad"])
+
+
+@pytest.mark.asyncio
+async def test_texts_no_longer_requested_are_evicted(tmp_path):
+    '''Rows for texts missing from the latest call are dropped from both files.'''
+    cache = EmbeddingCache(tmp_path)
+    await cache.get_or_compute(["a", "bb", "ccc"], "model-1", make_embed_fn())
+
+    result = await cache.get_or_compute(["ccc", "a"], "model-1", make_embed_fn())
+
+    assert result == [[3.0] * 3, [1.0] * 3]
+    index = json.loads((tmp_path / EmbeddingCache.INDEX_FILE).read_text())
+    assert set(index["rows"]) == {
+        EmbeddingCache.make_key("model-1", "a"), EmbeddingCache.make_key("model-1", "ccc")
+    }
+    assert (tmp_path / EmbeddingCache.VECTORS_FILE).stat().st_size == 2 * 3 * 2
+    embed_fn = make_embed_fn()
+    assert await cache.get_or_compute(["a", "ccc"], "model-1", embed_fn) == [[1.0] * 3, [3.0] * 3]
+    embed_fn.assert_not_awaited()
+
+
+def test_rejects_unsupported_dtype(tmp_path):
+    '''Only float16 and float32 storage are supported.'''
+    with pytest.raises(ValueError):
+        EmbeddingCache(tmp_path, dtype="int8")
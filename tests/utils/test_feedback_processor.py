@@ -0,0 +1,53 @@
+'''Tests for batched feedback processing.'''
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.memory.feedback_store import FeedbackStore
+from src.models.feedback_record import FeedbackRecord
+from src.utils.feedback_processor import FeedbackProcessor
+
+
+@pytest.fixture
+def feedback_store(tmp_path):
+    '''Feedback store backed by a temporary JSONL file.'''
+    return FeedbackStore(str(tmp_path / "feedback.jsonl"))
+
+
+@pytest.mark.asyncio
+async def test_batch_rewrites_feedback_file_once(feedback_store):
+    '''A batch marks every record applied with a single file rewrite.'''
+    records = [FeedbackRecord(query=f"q{i}", incorrect_srm_id="SRM-001") for i in range(5)]
+    for record in records:
+        feedback_store.add_feedback(record)
+    feedback_store._rewrite_feedback_file = MagicMock(wraps=feedback_store._rewrite_feedback_file)
+    processor = FeedbackProcessor(feedback_store, MagicMock(update_feedback_scores=AsyncMock()))
+
+    results = await processor.process_feedback_batch(records)
+
+    assert results == [True] * 5
+    assert all(record.applied_to_index for record in records)
+    feedback_store._rewrite_feedback_file.assert_called_once()
+    assert FeedbackStore(str(feedback_store.feedback_file)).get_unapplied_feedback() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_record_is_not_marked_applied(feedback_store):
+    '''A record whose index update fails stays unapplied; the rest succeed.'''
+    good = FeedbackRecord(query="good", incorrect_srm_id="SRM-001")
+    bad = FeedbackRecord(query="bad", incorrect_srm_id="SRM-002")
+    feedback_store.add_feedback(good)
+    feedback_store.add_feedback(bad)
+
+    async def update_feedback_scores(srm_id, **kwargs):
+        if srm_id == "SRM-002":
+            raise RuntimeError("index unavailable")
+
+    vector_store = MagicMock(update_feedback_scores=AsyncMock(side_effect=update_feedback_scores))
+    processor = FeedbackProcessor(feedback_store, vector_store)
+
+    results = await processor.process_feedback_batch([good, bad])
+
+    assert results == [True, False]
+    assert good.applied_to_index
+    assert not bad.applied_to_index
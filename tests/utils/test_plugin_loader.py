@@ -0,0 +1,37 @@
+'''Tests for prompt plugin file loading.'''
+
+import os
+
+from semantic_kernel import Kernel
+
+from src.utils.plugin_loader import load_prompt_plugin
+
+
+def _write_plugin(plugin_dir, description, template):
+    plugin_dir.mkdir(exist_ok=True)
+    (plugin_dir / 'config.json').write_text(f'{{"description": "{description}"}}', encoding='utf-8')
+    (plugin_dir / 'skprompt.txt').write_text(template, encoding='utf-8')
+
+
+def _template(kernel):
+    return kernel.get_function('echo', 'echo').prompt_template.prompt_template_config.template
+
+
+def test_edited_plugin_files_are_reloaded(tmp_path):
+    '''Unchanged files are served from cache; edited files are read again.'''
+    plugin_dir = tmp_path / 'echo'
+    _write_plugin(plugin_dir, 'first', 'Say {{$input}}')
+
+    first = Kernel()
+    load_prompt_plugin(first, 'echo', str(plugin_dir))
+    second = Kernel()
+    load_prompt_plugin(second, 'echo', str(plugin_dir))
+    assert _template(second) == 'Say {{$input}}'
+
+    _write_plugin(plugin_dir, 'second', 'Repeat {{$input}} twice')
+    stat = (plugin_dir / 'skprompt.txt').stat()
+    os.utime(plugin_dir / 'skprompt.txt', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = Kernel()
+    load_prompt_plugin(third, 'echo', str(plugin_dir))
+    assert _template(third) == 'Repeat {{$input}} twice'
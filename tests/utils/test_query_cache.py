@@ -0,0 +1,83 @@
+'''Tests for the in-memory query answer cache.'''
+
+from src.utils import query_cache
+from src.utils.query_cache import QueryCache, normalize_query
+
+
+def test_normalize_query_collapses_case_and_whitespace():
+    '''Queries differing only in case and spacing share a key.'''
+    assert normalize_query("  Restore   a\tBACKUP ") == "restore a backup"
+
+
+def test_hit_after_put_with_equivalent_query():
+    '''A stored answer is returned for an equivalent query.'''
+    cache = QueryCache()
+    cache.put("Restore a backup", "SRM-001")
+
+    assert cache.get("restore  a BACKUP") == "SRM-001"
+    assert cache.get("provision a vm") is None
+
+
+def test_evicts_least_recently_used():
+    '''The least recently used entry is evicted once maxsize is exceeded.'''
+    cache = QueryCache(maxsize=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    '''Entries older than the TTL are not returned.'''
+    now = [100.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(ttl=10)
+    cache.put("a", "1")
+
+    now[0] += 11
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_zero_maxsize_disables_cache():
+    '''A maxsize of 0 never stores anything.'''
+    cache = QueryCache(maxsize=0)
+    cache.put("a", "1")
+
+    assert cache.get("a") is None
+
+
+def test_bypass_pattern_skips_matching_queries():
+    '''Queries matching the bypass pattern are neither stored nor served.'''
+    cache = QueryCache(bypass_pattern=r"\b(today|status)\b")
+    cache.put("Outage STATUS for backups", "1")
+    cache.put("restore a backup", "2")
+
+    assert cache.get("outage status for backups") is None
+    assert cache.get("restore a backup") == "2"
+
+
+def test_clear_drops_all_entries():
+    '''clear() empties the cache.'''
+    cache = QueryCache()
+    cache.put("a", "1")
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def test_put_from_before_clear_is_dropped():
+    '''An answer computed before clear() is not stored afterwards.'''
+    cache = QueryCache()
+    stale_generation = cache.generation
+    cache.clear()
+    cache.put("a", "stale", generation=stale_generation)
+    cache.put("b", "fresh", generation=cache.generation)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "fresh"
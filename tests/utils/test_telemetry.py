@@ -0,0 +1,113 @@
+'''Tests for JSONL telemetry logging and batched writes.'''
+
+import asyncio
+import json
+
+import pytest
+
+from src.utils.telemetry import TelemetryLogger
+
+
+def read_events(logger: TelemetryLogger) -> list[dict]:
+    '''Read all events written to the logger's JSONL file.'''
+    if not logger.log_file.exists():
+        return []
+    return [json.loads(line) for line in logger.log_file.read_text(encoding='utf-8').splitlines()]
+
+
+def test_emit_writes_immediately_when_not_started(tmp_path):
+    '''Without start(), each event is appended as it is emitted.'''
+    logger = TelemetryLogger(log_dir=tmp_path)
+
+    logger.log_error(session_id="s1", error_code="E", error_message="boom")
+
+    events = read_events(logger)
+    assert [event['event_type'] for event in events] == ['error']
+    assert 'ts' in events[0]
+
+
+@pytest.mark.asyncio
+async def test_started_logger_buffers_until_flush(tmp_path):
+    '''After start(), events are written by the flush task, not by emit.'''
+    logger = TelemetryLogger(log_dir=tmp_path, flush_interval=60)
+    logger.start()
+
+    logger.log_answer_published(session_id="s1", selected_id="SRM-001", confidence=0.9)
+    assert read_events(logger) == []
+
+    await logger.aclose()
+    assert [event['selected_id'] for event in read_events(logger)] == ['SRM-001']
+
+
+@pytest.mark.asyncio
+async def test_full_batch_triggers_early_flush(tmp_path):
+    '''Reaching batch_size wakes the flush task before the interval elapses.'''
+    logger = TelemetryLogger(log_dir=tmp_path, flush_interval=60, batch_size=3)
+    logger.start()
+
+    for i in range(3):
+        logger.log_feedback_processed(feedback_id=f"f{i}", success=True)
+    for _ in range(50):
+        if len(read_events(logger)) == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    assert [event['feedback_id'] for event in read_events(logger)] == ['f0', 'f1', 'f2']
+    await logger.aclose()
+
+
+@pytest.mark.asyncio
+async def test_flush_task_sleeps_while_idle(tmp_path, monkeypatch):
+    '''The flush task only flushes once an event is pending.'''
+    logger = TelemetryLogger(log_dir=tmp_path, flush_interval=0.01)
+    flushes = []
+    flush = logger.flush
+    monkeypatch.setattr(logger, 'flush', lambda: (flushes.append(1), flush()))
+    logger.start()
+
+    await asyncio.sleep(0.1)
+    assert flushes == []
+
+    logger.log_error(session_id="s1", error_code="E", error_message="boom")
+    for _ in range(50):
+        if read_events(logger):
+            break
+        await asyncio.sleep(0.01)
+
+    assert [event['event_type'] for event in read_events(logger)] == ['error']
+    assert len(flushes) == 1
+    await logger.aclose()
+
+
+@pytest.mark.asyncio
+async def test_emit_from_worker_thread(tmp_path):
+    '''Events emitted from threadpool calls are buffered and flushed.'''
+    logger = TelemetryLogger(log_dir=tmp_path, flush_interval=60)
+    logger.start()
+
+    await asyncio.to_thread(
+        logger.log_feedback_submitted,
+        session_id="s1",
+        feedback_id="f1",
+        feedback_type="positive",
+        incorrect_srm_id=None,
+        correct_srm_id=None,
+    )
+    await logger.aclose()
+
+    assert [event['event_type'] for event in read_events(logger)] == ['feedback_submitted']
+
+
+@pytest.mark.asyncio
+async def test_null_logger_discards_events(tmp_path, monkeypatch):
+    '''The null logger accepts every log call and writes nothing.'''
+    from src.utils.telemetry import NullTelemetryLogger
+
+    monkeypatch.chdir(tmp_path)
+    logger = NullTelemetryLogger()
+    logger.start()
+    logger.log_answer_published(session_id="s1", selected_id="SRM-001", confidence=0.9)
+    logger.log_error(session_id="s1", error_code="E", error_message="boom")
+    await logger.aclose()
+
+    assert list(tmp_path.iterdir()) == []
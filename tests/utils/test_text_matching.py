@@ -112,3 +112,60 @@ def test_search_record_fields_no_match():
 
     score = search_record_fields("database restore", record)
     assert score < 0.7  # Should be lower than good matches (fuzzy allows some incidental overlap)
+
+
+def test_extract_tokens_returns_independent_lists():
+    '''Mutating a returned token list does not affect later calls.'''
+    tokens = extract_tokens("Database Restore")
+    tokens.append("extra")
+
+    assert extract_tokens("Database Restore") == ["database", "restore"]
+
+
+def test_score_records_matches_brute_force():
+    '''Pruned batch scoring equals scoring every pair exhaustively.'''
+    from src.utils.text_matching import score_records
+
+    records = [
+        SRMRecord(name="VM Provisioning", category="Provisioning", owning_team="Cloud Team",
+                  use_case="Create virtual machines", text=""),
+        SRMRecord(name="Database Restore", category="Restore", owning_team="Data Team",
+                  use_case="Restore database backups", text=""),
+        SRMRecord(name="VM Snapshot", category="Backup", owning_team="Cloud Team",
+                  use_case="Snapshot virtual machines for backup", text=""),
+    ]
+    weights = {'name': 1.0, 'category': 0.7, 'use_case': 1.0}
+
+    def brute_force(query, record):
+        best = 0.0
+        for field_name, weight in weights.items():
+            value = getattr(record, field_name)
+            best = max(best, fuzzy_match_score(query, value) * weight)
+            for q_token in extract_tokens(query):
+                for f_token in extract_tokens(value):
+                    best = max(best, fuzzy_match_score(q_token, f_token) * weight)
+        return best
+
+    for query in ["restore databse", "vm backup", "provision a virtual machine"]:
+        assert score_records(query, records) == [brute_force(query, record) for record in records]
+
+
+def test_shared_pair_cache_is_bounded_and_exact(monkeypatch):
+    '''Scores are unchanged when the shared pair cache fills and is cleared.'''
+    from src.utils import text_matching
+
+    records = [
+        SRMRecord(name="VM Provisioning", category="Provisioning", owning_team="Cloud Team",
+                  use_case="Create virtual machines", text=""),
+        SRMRecord(name="Database Restore", category="Restore", owning_team="Data Team",
+                  use_case="Restore database backups", text=""),
+    ]
+    queries = ["restore databse", "vm backup", "provision a virtual machine"]
+    text_matching._pair_ratios.clear()
+    expected = [text_matching.score_records(query, records) for query in queries]
+
+    monkeypatch.setattr(text_matching, '_PAIR_RATIO_CACHE_SIZE', 3)
+    text_matching._pair_ratios.clear()
+    for _ in range(2):
+        assert [text_matching.score_records(query, records) for query in queries] == expected
+        assert len(text_matching._pair_ratios) <= 3